@@ -42,8 +42,10 @@ async def get_session(request: Request) -> AsyncIterator[AsyncSession]:
         await session.close()
 
 
-async def get_db(request: Request) -> InfrahubDatabase:
-    return request.app.state.db.start_session()
+async def get_db(request: Request) -> AsyncIterator[InfrahubDatabase]:
+    # A single session is opened per request and shared by all the queries and transactions of the request
+    async with request.app.state.db.start_session() as db:
+        yield db
 
 
 async def get_access_token(
@@ -55,7 +55,7 @@ async def get_diff_data(
         branch_only=query.branch_only,
         namespaces_exclude=["Schema"],
     )
-    schema = registry.schema.get_full(branch=branch)
+    schema = registry.schema.get_full(branch=branch, duplicate=False)
     diff_payload_builder = DiffPayloadBuilder(db=db, diff=diff, kinds_to_include=list(schema.keys()))
     return await diff_payload_builder.get_branch_diff()
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, Union
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Set, Union
 
 from typing_extensions import Self
 
@@ -435,11 +435,34 @@ class BranchDiffer:
 
         return paths
 
+    async def calculate_nodes_and_relationships(self) -> None:
+        """Calculate the diff for the nodes and the relationships concurrently, if not already done.
+
+        Each calculation is using its own session, unless the database is in a transaction
+        in which case they are calculated one after the other within this transaction.
+        """
+        calculations: List[Callable[..., Awaitable[None]]] = []
+        if not self._calculated_diff_nodes_at:
+            calculations.append(self._calculate_diff_nodes)
+        if not self._calculated_diff_rels_at:
+            calculations.append(self._calculated_diff_rels)
+
+        if self.db.is_transaction or len(calculations) < 2:
+            for calculation in calculations:
+                await calculation(db=self.db)
+            return
+
+        async def _calculate_in_session(calculation: Callable[..., Awaitable[None]]) -> None:
+            async with self.db.start_session(read_only=True) as db:
+                await calculation(db=db)
+
+        await asyncio.gather(*[_calculate_in_session(calculation) for calculation in calculations])
+
     async def get_nodes(self) -> Dict[str, Dict[str, NodeDiffElement]]:
         """Return all the nodes calculated by the diff, organized by branch."""
 
         if not self._calculated_diff_nodes_at:
-            await self._calculate_diff_nodes()
+            await self._calculate_diff_nodes(db=self.db)
 
         return {
             branch_name: data["nodes"]
@@ -447,7 +470,7 @@ class BranchDiffer:
             if not self.branch_only or branch_name == self.branch.name
         }
 
-    async def _calculate_diff_nodes(self) -> None:
+    async def _calculate_diff_nodes(self, db: InfrahubDatabase) -> None:
         """Calculate the diff for all the nodes and attributes.
 
         The results will be stored in self._results organized by branch.
@@ -456,7 +479,7 @@ class BranchDiffer:
         # Process nodes that have been Added or Removed first
         # ------------------------------------------------------------
         query_nodes = await DiffNodeQuery.init(
-            db=self.db,
+            db=db,
             branch=self.branch,
             diff_from=self.diff_from,
             diff_to=self.diff_to,
@@ -466,7 +489,7 @@ class BranchDiffer:
             kinds_exclude=self.kinds_exclude,
             branch_support=self.branch_support,
         )
-        await query_nodes.execute(db=self.db)
+        await query_nodes.execute(db=db)
 
         for result in query_nodes.get_results():
             node_id = result.get("n").get("uuid")
@@ -511,7 +534,7 @@ class BranchDiffer:
         # ------------------------------------------------------------
         attrs_to_query = set()
         query_attrs = await DiffAttributeQuery.init(
-            db=self.db,
+            db=db,
             branch=self.branch,
             diff_from=self.diff_from,
             diff_to=self.diff_to,
@@ -521,7 +544,7 @@ class BranchDiffer:
             kinds_exclude=self.kinds_exclude,
             branch_support=self.branch_support,
         )
-        await query_attrs.execute(db=self.db)
+        await query_attrs.execute(db=db)
 
         for result in query_attrs.get_results():
             node_id = result.get("n").get("uuid")
@@ -596,13 +619,13 @@ class BranchDiffer:
         # Query the current value for all attributes that have been updated
         # ------------------------------------------------------------
         origin_attr_query = await DiffNodePropertiesByIDSQuery.init(
-            db=self.db,
+            db=db,
             ids=list(attrs_to_query),
             branch=self.branch,
             at=self.diff_from,
         )
 
-        await origin_attr_query.execute(db=self.db)
+        await origin_attr_query.execute(db=db)
 
         for result in query_attrs.get_results():
             node_id = result.get("n").get("uuid")
@@ -665,7 +688,7 @@ class BranchDiffer:
 
     async def get_relationships(self) -> Dict[str, Dict[str, Dict[str, RelationshipDiffElement]]]:
         if not self._calculated_diff_rels_at:
-            await self._calculated_diff_rels()
+            await self._calculated_diff_rels(db=self.db)
 
         return {
             branch_name: data["rels"]
@@ -677,14 +700,14 @@ class BranchDiffer:
         rels = await self.get_relationships()
 
         # Organize the Relationships data per node and per relationship name in order to simplify the association with the nodes Later on.
-        rels_per_node: Dict[str, Dict[str, Dict[str, List[RelationshipDiffElement]]]] = defaultdict(
-            lambda: defaultdict(lambda: defaultdict(list))
-        )
+        rels_per_node: Dict[str, Dict[str, Dict[str, List[RelationshipDiffElement]]]] = {}
         for branch_name, items in rels.items():
+            branch_rels_per_node = rels_per_node.setdefault(branch_name, {})
             for item in items.values():
                 for rel_diff_element in item.values():
-                    for node_id, _ in rel_diff_element.nodes.items():
-                        rels_per_node[branch_name][node_id][rel_diff_element.name].append(rel_diff_element)
+                    rel_name = rel_diff_element.name
+                    for node_id in rel_diff_element.nodes:
+                        branch_rels_per_node.setdefault(node_id, {}).setdefault(rel_name, []).append(rel_diff_element)
 
         return rels_per_node
 
@@ -693,24 +716,28 @@ class BranchDiffer:
         rels = await self.get_relationships()
         nodes = await self.get_nodes()
 
-        node_ids: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
+        # Use dicts as ordered sets to avoid scanning the list of IDs for every node
+        node_ids: Dict[str, Dict[str, Dict[str, None]]] = {}
 
         for branch_name, rel_items in rels.items():
+            branch_node_ids = node_ids.setdefault(branch_name, {})
             for rel_item in rel_items.values():
                 for sub_item in rel_item.values():
                     for node_id, node in sub_item.nodes.items():
-                        if node_id not in node_ids[branch_name][node.kind]:
-                            node_ids[branch_name][node.kind].append(node_id)
+                        branch_node_ids.setdefault(node.kind, {})[node_id] = None
 
         # Extract the id of all nodes ahead of time in order to query all display labels
         for branch_name, node_items in nodes.items():
+            branch_node_ids = node_ids.setdefault(branch_name, {})
             for node_item in node_items.values():
-                if node_item.id not in node_ids[branch_name][node_item.kind]:
-                    node_ids[branch_name][node_item.kind].append(node_item.id)
+                branch_node_ids.setdefault(node_item.kind, {})[node_item.id] = None
 
-        return node_ids
+        return {
+            branch_name: {kind: list(ids) for kind, ids in ids_per_kind.items()}
+            for branch_name, ids_per_kind in node_ids.items()
+        }
 
-    async def _calculated_diff_rels(self) -> None:
+    async def _calculated_diff_rels(self, db: InfrahubDatabase) -> None:
         """Calculate the diff for all the relationships between Nodes.
 
         The results will be stored in self._results organized by branch.
@@ -723,7 +750,7 @@ class BranchDiffer:
         #   to identify the relationship that have been ADDED or DELETED
         # ------------------------------------------------------------
         query_rels = await DiffRelationshipQuery.init(
-            db=self.db,
+            db=db,
             branch=self.branch,
             diff_from=self.diff_from,
             diff_to=self.diff_to,
@@ -733,7 +760,7 @@ class BranchDiffer:
             kinds_exclude=self.kinds_exclude,
             branch_support=self.branch_support,
         )
-        await query_rels.execute(db=self.db)
+        await query_rels.execute(db=db)
 
         for result in query_rels.get_results():
             branch_name = result.get("r1").get("branch")
@@ -796,9 +823,9 @@ class BranchDiffer:
         #  Then we can process the properties themselves
         # ------------------------------------------------------------
         query_props = await DiffRelationshipPropertyQuery.init(
-            db=self.db, branch=self.branch, diff_from=self.diff_from, diff_to=self.diff_to
+            db=db, branch=self.branch, diff_from=self.diff_from, diff_to=self.diff_to
         )
-        await query_props.execute(db=self.db)
+        await query_props.execute(db=db)
 
         for result in query_props.get_results():
             branch_name = result.get("r3").get("branch")
@@ -853,13 +880,13 @@ class BranchDiffer:
         #  Usually we need more information to determine if the rel has been updated, added or removed
         # ------------------------------------------------------------
         origin_rel_properties_query = await DiffRelationshipPropertiesByIDSRangeQuery.init(
-            db=self.db,
+            db=db,
             ids=rel_ids_to_query,
             branch=self.branch,
             diff_from=self.diff_from,
             diff_to=self.diff_to,
         )
-        await origin_rel_properties_query.execute(db=self.db)
+        await origin_rel_properties_query.execute(db=db)
 
         for result in query_props.get_results():
             branch_name = result.get("r3").get("branch")
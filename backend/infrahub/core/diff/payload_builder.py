@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import copy
 from collections import defaultdict
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
 
 from infrahub.core.constants import DiffAction, RelationshipCardinality
 from infrahub.core.manager import NodeManager
@@ -32,10 +32,12 @@ from .model import (
 )
 
 if TYPE_CHECKING:
+    from infrahub.core.schema import MainSchemaTypes
+    from infrahub.core.schema.relationship_schema import RelationshipSchema
     from infrahub.database import InfrahubDatabase
 
     from .branch_differ import BranchDiffer
-    from .model import NodeDiffElement, RelationshipDiffElement
+    from .model import NodeDiffElement, RelationshipDiffElement, RelationshipEdgeNodeDiffElement
 
 
 log = get_logger(__name__)
@@ -69,7 +71,7 @@ class DiffPayloadBuilder:
     def __init__(self, db: InfrahubDatabase, diff: BranchDiffer, kinds_to_include: Optional[List[str]] = None):
         self.db = db
         self.diff = diff
-        self.kinds_to_include = kinds_to_include
+        self.kinds_to_include: Optional[Set[str]] = set(kinds_to_include) if kinds_to_include else None
         self.diffs: List[BranchDiffNode] = []
         self.entries: Dict[str, BranchDiffEntry] = {}
         self.rels_per_node: Dict[str, Dict[str, Dict[str, List[RelationshipDiffElement]]]] = {}
@@ -77,6 +79,8 @@ class DiffPayloadBuilder:
         self.rels: Dict[str, Dict[str, Dict[str, RelationshipDiffElement]]] = {}
         self.nodes: Dict[str, Dict[str, NodeDiffElement]] = {}
         self.is_parsed: bool = False
+        self._schemas: Dict[Tuple[str, Optional[str]], MainSchemaTypes] = {}
+        self._rel_schemas: Dict[Tuple[str, Optional[str], str], Optional[RelationshipSchema]] = {}
 
     def _add_node_summary(self, branch_diff_node: BranchDiffNode, action: DiffAction) -> None:
         self.entries[branch_diff_node.id].summary.inc(action.value)
@@ -97,6 +101,23 @@ class DiffPayloadBuilder:
     def _set_node_action(self, node_id: str, branch: str, action: DiffAction) -> None:
         self.entries[node_id].action[branch] = action
 
+    def _get_relationship_schema(
+        self, kind: str, branch_name: Optional[str], identifier: str
+    ) -> Optional[RelationshipSchema]:
+        # Many nodes in a diff share the same kind and relationship identifiers,
+        # cache the lookups to avoid walking the schema for every relationship
+        rel_key = (kind, branch_name, identifier)
+        if rel_key in self._rel_schemas:
+            return self._rel_schemas[rel_key]
+
+        schema_key = (kind, branch_name)
+        if schema_key not in self._schemas:
+            self._schemas[schema_key] = self.db.schema.get(name=kind, branch=branch_name, duplicate=False)
+
+        rel_schema = self._schemas[schema_key].get_relationship_by_identifier(id=identifier, raise_on_error=False)
+        self._rel_schemas[rel_key] = rel_schema
+        return rel_schema
+
     async def _prepare(self) -> None:
         self.rels_per_node = await self.diff.get_relationships_per_node()
         node_ids = await self.diff.get_node_id_per_kind()
@@ -133,7 +154,7 @@ class DiffPayloadBuilder:
             if not change.value:
                 change.value = BranchDiffPropertyCollection(path=f"data/{node_id}/{element.name}/value")
             change.value.changes.append(
-                BranchDiffProperty(
+                BranchDiffProperty.model_construct(
                     branch=branch,
                     type=element.value.type,
                     changed_at=element.value.changed_at,
@@ -278,14 +299,16 @@ class DiffPayloadBuilder:
 
     async def _process_nodes(self) -> None:
         # Generate the Diff per node and associated the appropriate relationships if they are present in the schema
+        kinds_to_include = self.kinds_to_include
+        add_diff = self.diffs.append
         for branch_name, items in self.nodes.items():
             for item in items.values():
-                if self.kinds_to_include and item.kind not in self.kinds_to_include:
+                if kinds_to_include and item.kind not in kinds_to_include:
                     continue
 
                 branch_diff_node = await self._process_one_node(node_diff=item, branch_name=branch_name)
 
-                self.diffs.append(branch_diff_node)
+                add_diff(branch_diff_node)
 
     async def _process_one_node(self, node_diff: NodeDiffElement, branch_name: str) -> BranchDiffNode:
         node_diff_graphql = node_diff.to_graphql()
@@ -301,7 +324,6 @@ class DiffPayloadBuilder:
         self._add_node_to_diff(node_id=node_diff_dict["id"], kind=node_diff_dict["kind"])
         self._set_display_label(node_id=node_diff_dict["id"], branch=branch_name, display_label=display_label)
         self._set_node_action(node_id=node_diff_dict["id"], branch=branch_name, action=node_diff_dict["action"])
-        schema = self.db.schema.get(name=node_diff.kind, branch=node_diff.branch)
 
         # Extract the value from the list of properties
         for element in branch_diff_node.elements.values():
@@ -319,18 +341,22 @@ class DiffPayloadBuilder:
                 element.properties.remove(element.value)
             self._add_node_element_attribute(branch_diff_node=branch_diff_node, element=element)
 
-        if branch_diff_node.id not in self.rels_per_node[branch_name]:
+        relationship_diffs_by_name = self.rels_per_node.get(branch_name, {}).get(branch_diff_node.id)
+        if not relationship_diffs_by_name:
             return branch_diff_node
 
         branch_display_label_map = self._get_branch_display_label_map(branch_name)
-        for rel_name, rels in self.rels_per_node[branch_name][branch_diff_node.id].items():
-            rel_schema = schema.get_relationship_by_identifier(id=rel_name, raise_on_error=False)
+        node_id = branch_diff_node.id
+        node_kind = node_diff.kind
+        node_branch = node_diff.branch
+        for rel_name, rels in relationship_diffs_by_name.items():
+            rel_schema = self._get_relationship_schema(kind=node_kind, branch_name=node_branch, identifier=rel_name)
             if not rel_schema:
                 continue
             diff_rel: Optional[Union[BranchDiffRelationshipOne, BranchDiffRelationshipMany]] = None
             if rel_schema.cardinality == RelationshipCardinality.ONE:
                 diff_rel = extract_diff_relationship_one(
-                    node_id=branch_diff_node.id,
+                    node_id=node_id,
                     name=rel_schema.name,
                     identifier=rel_name,
                     rels=rels,
@@ -338,7 +364,7 @@ class DiffPayloadBuilder:
                 )
             elif rel_schema.cardinality == RelationshipCardinality.MANY:
                 diff_rel = extract_diff_relationship_many(
-                    node_id=branch_diff_node.id,
+                    node_id=node_id,
                     name=rel_schema.name,
                     identifier=rel_name,
                     rels=rels,
@@ -359,9 +385,11 @@ class DiffPayloadBuilder:
     async def _process_relationships(self) -> None:
         # Check if all nodes associated with a relationship have been accounted for
         # If a node is missing it means its changes are only related to its relationships
-        for branch_name, _ in self.rels_per_node.items():
-            for node_in_rel_id, relationship_diffs_by_name in self.rels_per_node[branch_name].items():
-                if node_in_rel_id in self.entries:
+        entries = self.entries
+        add_diff = self.diffs.append
+        for branch_name, rels_by_node in self.rels_per_node.items():
+            for node_in_rel_id, relationship_diffs_by_name in rels_by_node.items():
+                if node_in_rel_id in entries:
                     continue
 
                 branch_diff_node = await self._process_one_node_relationships(
@@ -371,7 +399,7 @@ class DiffPayloadBuilder:
                 )
 
                 if branch_diff_node:
-                    self.diffs.append(branch_diff_node)
+                    add_diff(branch_diff_node)
 
     async def _process_one_node_relationships(
         self, node_id: str, relationship_diffs_by_name: Dict[str, List[RelationshipDiffElement]], branch_name: str
@@ -379,14 +407,14 @@ class DiffPayloadBuilder:
         node_diff = None
         node_display_label = self._get_node_display_label(branch_name=branch_name, node_id=node_id)
         branch_display_label_map = self._get_branch_display_label_map(branch_name)
+        kinds_to_include = self.kinds_to_include
         for rel_name, rels in relationship_diffs_by_name.items():
             node_kind = rels[0].nodes[node_id].kind
 
-            if self.kinds_to_include and node_kind not in self.kinds_to_include:
+            if kinds_to_include and node_kind not in kinds_to_include:
                 continue
 
-            schema = self.db.schema.get(name=node_kind, branch=branch_name)
-            rel_schema = schema.get_relationship_by_identifier(id=rel_name, raise_on_error=False)
+            rel_schema = self._get_relationship_schema(kind=node_kind, branch_name=branch_name, identifier=rel_name)
             if not rel_schema:
                 continue
 
@@ -398,13 +426,13 @@ class DiffPayloadBuilder:
                     action=DiffAction.UPDATED,
                     display_label=node_display_label,
                 )
-            self._add_node_to_diff(node_id=node_id, kind=node_kind)
-            self._set_display_label(
-                node_id=node_id,
-                branch=branch_name,
-                display_label=node_display_label,
-            )
-            self._set_node_action(node_id=node_id, branch=branch_name, action=DiffAction.UPDATED)
+                self._add_node_to_diff(node_id=node_id, kind=node_kind)
+                self._set_display_label(
+                    node_id=node_id,
+                    branch=branch_name,
+                    display_label=node_display_label,
+                )
+                self._set_node_action(node_id=node_id, branch=branch_name, action=DiffAction.UPDATED)
 
             diff_rel: Optional[Union[BranchDiffRelationshipOne, BranchDiffRelationshipMany]] = None
             if rel_schema.cardinality == RelationshipCardinality.ONE:
@@ -440,6 +468,7 @@ class DiffPayloadBuilder:
     async def _parse_diff(self) -> None:
         # Query the Diff per Nodes and per Relationships from the database
 
+        await self.diff.calculate_nodes_and_relationships()
         self.nodes = await self.diff.get_nodes()
         self.rels = await self.diff.get_relationships()
 
@@ -469,6 +498,14 @@ class DiffPayloadBuilder:
         return self.diffs
 
 
+def _build_peer_node(
+    rel_node: RelationshipEdgeNodeDiffElement, display_labels: Dict[str, str]
+) -> BranchDiffRelationshipPeerNode:
+    return BranchDiffRelationshipPeerNode.model_construct(
+        id=rel_node.id, kind=rel_node.kind, display_label=display_labels.get(rel_node.id, "")
+    )
+
+
 def extract_diff_relationship_one(
     node_id: str, name: str, identifier: str, rels: List[RelationshipDiffElement], display_labels: Dict[str, str]
 ) -> Optional[BranchDiffRelationshipOne]:
@@ -492,27 +529,26 @@ def extract_diff_relationship_one(
         if rel.changed_at:
             changed_at = rel.changed_at.to_string()
 
-        peer_list = [rel_node for rel_node in rel.nodes.values() if rel_node.id != node_id]
-        if not peer_list:
+        peer_node = next((rel_node for rel_node in rel.nodes.values() if rel_node.id != node_id), None)
+        if not peer_node:
             log.warning(
                 f"extract_diff_relationship_one: unable to find the peer associated with the node {node_id}, Name: {name}"
             )
             return None
 
-        peer = dict(peer_list[0])
-        peer["display_label"] = display_labels.get(peer.get("id", None), "")
+        peer = _build_peer_node(rel_node=peer_node, display_labels=display_labels)
 
         if rel.action.value == "added":
-            peer_value = {"new": peer}
+            peer_value = BranchDiffRelationshipOnePeerValue.model_construct(new=peer)
         else:
-            peer_value = {"previous": peer}
+            peer_value = BranchDiffRelationshipOnePeerValue.model_construct(previous=peer)
 
         return BranchDiffRelationshipOne(
             branch=rel.branch,
             id=rel.id,
             name=name,
             identifier=identifier,
-            peer=BranchDiffRelationshipOnePeerValue.model_validate(peer_value),
+            peer=peer_value,
             properties=[BranchDiffProperty(**prop.to_graphql()) for prop in rel.properties.values()],
             changed_at=changed_at,
             action=rel.action,
@@ -525,19 +561,21 @@ def extract_diff_relationship_one(
         rel_added = unique_action_rels_map[DiffAction.ADDED]
         rel_removed = unique_action_rels_map[DiffAction.REMOVED]
 
-        peer_added = dict([rel_node for rel_node in rel_added.nodes.values() if rel_node.id != node_id][0])
-        peer_added["display_label"] = display_labels.get(peer_added.get("id", None), "")
-
-        peer_removed = dict([rel_node for rel_node in rel_removed.nodes.values() if rel_node.id != node_id][0])
-        peer_removed["display_label"] = display_labels.get(peer_removed.get("id", None), "")
-        peer_value = {"new": dict(peer_added), "previous": dict(peer_removed)}
+        peer_added = _build_peer_node(
+            rel_node=next(rel_node for rel_node in rel_added.nodes.values() if rel_node.id != node_id),
+            display_labels=display_labels,
+        )
+        peer_removed = _build_peer_node(
+            rel_node=next(rel_node for rel_node in rel_removed.nodes.values() if rel_node.id != node_id),
+            display_labels=display_labels,
+        )
 
         return BranchDiffRelationshipOne(
             branch=rel_added.branch,
             id=rel_added.id,
             name=name,
             identifier=identifier,
-            peer=BranchDiffRelationshipOnePeerValue.model_validate(peer_value),
+            peer=BranchDiffRelationshipOnePeerValue.model_construct(new=peer_added, previous=peer_removed),
             properties=[BranchDiffProperty(**prop.to_graphql()) for prop in rel_added.properties.values()],
             changed_at=changed_at,
             action=DiffAction.UPDATED,
@@ -570,10 +608,10 @@ def extract_diff_relationship_many(
         if rel.changed_at:
             changed_at = rel.changed_at.to_string()
 
-        peer = [rel_node for rel_node in rel.nodes.values() if rel_node.id != node_id][0].model_dump(
-            exclude={"db_id", "labels"}
+        peer = _build_peer_node(
+            rel_node=next(rel_node for rel_node in rel.nodes.values() if rel_node.id != node_id),
+            display_labels=display_labels,
         )
-        peer["display_label"] = display_labels.get(peer["id"], "")
 
         rel_diff.summary.inc(rel.action.value)
 
@@ -582,7 +620,7 @@ def extract_diff_relationship_many(
                 branch=rel.branch,
                 id=rel.id,
                 identifier=identifier,
-                peer=BranchDiffRelationshipPeerNode(**peer),
+                peer=peer,
                 properties=[BranchDiffProperty(**prop.to_graphql()) for prop in rel.properties.values()],
                 changed_at=changed_at,
                 action=rel.action,
@@ -149,3 +149,15 @@ class PrefixUtilizationGetter:
             grand_total_used += prefix_total_used
             grand_total_space += prefix_total_space
         return (grand_total_used / grand_total_space) * 100
+
+    async def get_use_percentage_per_prefix(
+        self, ip_prefixes: Optional[list[Node]] = None, branch_names: Optional[list[str]] = None
+    ) -> dict[str, float]:
+        """Return the utilization of each prefix individually, organized by prefix ID."""
+        if ip_prefixes is None:
+            ip_prefixes = self.ip_prefixes
+        await self._fetch_data()
+        return {
+            ip_prefix.get_id(): await self.get_use_percentage(ip_prefixes=[ip_prefix], branch_names=branch_names)
+            for ip_prefix in ip_prefixes
+        }
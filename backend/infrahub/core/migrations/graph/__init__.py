@@ -31,11 +31,9 @@ MIGRATIONS: List[type[Union[GraphMigration, InternalSchemaMigration]]] = [
 
 
 async def get_graph_migrations(root: Root) -> Sequence[Union[GraphMigration, InternalSchemaMigration]]:
-    applicable_migrations = []
-    for migration_class in MIGRATIONS:
-        migration = migration_class.init()
-        if root.graph_version > migration.minimum_version:
-            continue
-        applicable_migrations.append(migration)
-
-    return applicable_migrations
+    # Check the version on the class before initializing the migration, some migrations load the internal schema
+    return [
+        migration_class.init()
+        for migration_class in MIGRATIONS
+        if root.graph_version <= migration_class.model_fields["minimum_version"].default
+    ]
@@ -487,9 +487,14 @@ class Query(ABC):
 
         if self.type == QueryType.READ:
             if self.limit or self.offset:
-                results = await db.execute_query(query=query_str, params=self.params, name=self.name)
+                # Build the results while the records are streamed from the database to avoid buffering them twice
+                self.results = [
+                    QueryResult(data=result, labels=self.return_labels)
+                    async for result in db.execute_query_iter(query=query_str, params=self.params, name=self.name)
+                ]
             else:
                 results = await self.query_with_size_limit(db=db)
+                self.results = [QueryResult(data=result, labels=self.return_labels) for result in results]
 
         elif self.type == QueryType.WRITE:
             results, metadata = await db.execute_query_with_metadata(
@@ -497,13 +502,13 @@ class Query(ABC):
             )
             if "stats" in metadata:
                 self.stats.add(metadata.get("stats"))
+            self.results = [QueryResult(data=result, labels=self.return_labels) for result in results]
         else:
             raise ValueError(f"unknown value for {self.type}")
 
-        if not results and self.raise_error_if_empty:
+        if not self.results and self.raise_error_if_empty:
             raise QueryError(query=query_str, params=self.params)
 
-        self.results = [QueryResult(data=result, labels=self.return_labels) for result in results]
         self.has_been_executed = True
 
         return self
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Dict, Optional, Type, Union
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Type, Union
 
 from infrahub import lock
 from infrahub.core.constants import GLOBAL_BRANCH_NAME
@@ -40,7 +40,7 @@ class Registry:
     _schema: Optional[SchemaManager] = None
     default_graphql_type: Dict[str, InfrahubObject] = field(default_factory=dict)
     graphql_type: dict = field(default_factory=lambda: defaultdict(dict))
-    data_type: Dict[str, Type[InfrahubDataType]] = field(default_factory=dict)
+    data_type: Mapping[str, Type[InfrahubDataType]] = field(default_factory=dict)
     input_type: Dict[str, Union[BaseAttributeCreate, BaseAttributeUpdate]] = field(default_factory=dict)
     account: dict = field(default_factory=dict)
     account_id: dict = field(default_factory=dict)
@@ -144,9 +144,9 @@ class Registry:
         self.account_id = {}
         self.node_group = {}
         self.attr_group = {}
-        self.data_type = {}
         self.attribute = {}
         self.input_type = {}
+        # data_type is not reset, it's the read-only view maintained by infrahub.types
 
     def get_branch_from_registry(self, branch: Optional[Union[Branch, str]] = None) -> Branch:
         """Return a branch object from the registry based on its name.
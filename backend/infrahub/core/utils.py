@@ -121,6 +121,39 @@ async def get_paths_between_nodes(
     return await db.execute_query(query=query, params=params, name="get_paths_between_nodes")
 
 
+async def count_paths_between_nodes(
+    db: InfrahubDatabase,
+    source_id: str,
+    destination_id: str,
+    relationships: Optional[List[str]] = None,
+    max_length: Optional[int] = None,
+) -> int:
+    """Return the number of paths between 2 nodes, without returning the paths themselves."""
+
+    length_limit = f"..{max_length}" if max_length else ""
+
+    relationships_str = ""
+    if isinstance(relationships, list):
+        relationships_str = ":" + "|".join(relationships)
+
+    query = """
+    MATCH p = (s)-[%s*%s]-(d)
+    WHERE ID(s) = $source_id AND ID(d) = $destination_id
+    RETURN count(p) as count
+    """ % (
+        relationships_str.upper(),
+        length_limit,
+    )
+
+    params = {
+        "source_id": element_id_to_id(source_id),
+        "destination_id": element_id_to_id(destination_id),
+    }
+
+    result = await db.execute_query(query=query, params=params, name="count_paths_between_nodes")
+    return result[0][0]
+
+
 async def count_relationships(db: InfrahubDatabase, label: Optional[str] = None) -> int:
     """Return the total number of relationships in the database."""
 
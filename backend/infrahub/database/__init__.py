@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import random
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple, Type, Union
 
 from neo4j import (
     READ_ACCESS,
@@ -102,7 +102,7 @@ class DatabaseSchemaManager:
     ) -> Dict[str, MainSchemaTypes]:
         branch_name = get_branch_name(branch=branch)
         if branch_name not in self._db._schemas:
-            return registry.schema.get_full(branch=branch)
+            return registry.schema.get_full(branch=branch, duplicate=duplicate)
         return self._db._schemas[branch_name].get_all(duplicate=duplicate)
 
     async def get_full_safe(
@@ -275,6 +275,26 @@ class InfrahubDatabase:
                 response = await self.run_query(query=query, params=params)
                 return [item async for item in response]
 
+    async def execute_query_iter(
+        self, query: str, params: Optional[Dict[str, Any]] = None, name: Optional[str] = "undefined"
+    ) -> AsyncIterator[Record]:
+        """Execute a query and yield the records as they are received from the database.
+
+        The records are not buffered in a list, so this should be preferred over execute_query
+        when the results are only consumed once.
+
+        The span and the execution metric only cover the execution of the query, they are closed
+        before the first record is yielded so the time spent by the consumer is not measured.
+        """
+        with trace.get_tracer(__name__).start_as_current_span("execute_db_query") as span:
+            span.set_attribute("query", query)
+
+            with QUERY_EXECUTION_METRICS.labels(self._session_mode.value, name).time():
+                response = await self.run_query(query=query, params=params)
+
+        async for item in response:
+            yield item
+
     async def execute_query_with_metadata(
         self, query: str, params: Optional[Dict[str, Any]] = None, name: Optional[str] = "undefined"
     ) -> Tuple[List[Record], Dict[str, Any]]:
@@ -338,20 +358,22 @@ async def validate_database(
         retry_interval (int, optional): Time between retries in second. Defaults to 1.
     """
 
-    try:
-        session = driver.session(database=database_name)
-        await session.run("SHOW TRANSACTIONS")
-        validated_database[database_name] = True
+    for attempt in range(retry + 1):
+        try:
+            session = driver.session(database=database_name)
+            await session.run("SHOW TRANSACTIONS")
+            validated_database[database_name] = True
+            break
 
-    except ClientError as exc:
-        if create_db and exc.code == "Neo.ClientError.Database.DatabaseNotFound":
-            await create_database(driver=driver, database_name=config.SETTINGS.database.database_name)
+        except ClientError as exc:
+            # Only try to create the database on the first attempt
+            if create_db and attempt == 0 and exc.code == "Neo.ClientError.Database.DatabaseNotFound":
+                await create_database(driver=driver, database_name=config.SETTINGS.database.database_name)
 
-        if retry == 0:
-            raise
+            if attempt == retry:
+                raise
 
-        await asyncio.sleep(retry_interval)
-        await validate_database(driver=driver, database_name=database_name, retry=retry - 1, create_db=False)
+            await asyncio.sleep(retry_interval)
 
     return True
 
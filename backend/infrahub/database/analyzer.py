@@ -2,7 +2,7 @@ import time
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -180,6 +180,22 @@ class InfrahubDatabaseAnalyzer(InfrahubDatabase):
 
         return response
 
+    async def execute_query_iter(
+        self, query: str, params: config.Dict[str, Any] | None = None, name: str | None = "undefined"
+    ) -> AsyncIterator[Record]:
+        if name and query_stats.sample_memory(name=name):
+            for record in await self.execute_query(query, params, name):
+                yield record
+            return
+
+        time_start = time.time()
+        async for record in super().execute_query_iter(query, params, name):
+            yield record
+        duration_time = time.time() - time_start
+        query_stats.add_measurement(
+            QueryMeasurement(duration=duration_time, profile=False, query_name=str(name), start_time=time_start)
+        )
+
     async def execute_query_with_metadata(
         self, query: str, params: config.Dict[str, Any] | None = None, name: str | None = "undefined"
     ) -> Tuple[List[Record], Dict[str, Any]]:
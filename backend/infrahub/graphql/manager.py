@@ -18,7 +18,7 @@ from infrahub.core.schema import (
 )
 from infrahub.graphql.mutations.attribute import BaseAttributeCreate, BaseAttributeUpdate
 from infrahub.graphql.mutations.graphql_query import InfrahubGraphQLQueryMutation
-from infrahub.types import ATTRIBUTE_TYPES, InfrahubDataType, get_attribute_type
+from infrahub.types import ATTRIBUTE_TYPES, InfrahubDataType, get_attribute_type, register_data_type
 
 from .directives import DIRECTIVES
 from .enums import generate_graphql_enum, get_enum_attribute_type_name
@@ -230,6 +230,7 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
                 graphql_type=data_type_class.get_graphql_type(),
             )
             ATTRIBUTE_TYPES[base_enum_name] = data_type_class
+            register_data_type(data_type_class)
 
     def _get_related_input_type(self, relationship: RelationshipSchema) -> type[RelatedNodeInput]:
         peer_schema = self.schema.get(name=relationship.peer, duplicate=False)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from enum import IntFlag
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 from graphene import Field, Float, Int, List, ObjectType, String
@@ -51,8 +52,31 @@ class PoolAllocatedEdge(ObjectType):
     node = Field(PoolAllocatedNode, required=True)
 
 
+VALID_POOL_KINDS = frozenset({InfrahubKind.IPADDRESSPOOL, InfrahubKind.IPPREFIXPOOL})
+UTILIZATION_FIELDS = frozenset({"utilization", "utilization_branches", "utilization_default_branch", "edges"})
+
+
+class UtilizationResourceField(IntFlag):
+    NONE = 0
+    ID = 1
+    KIND = 2
+    DISPLAY_LABEL = 4
+    WEIGHT = 8
+    UTILIZATION = 16
+    UTILIZATION_BRANCHES = 32
+    UTILIZATION_DEFAULT_BRANCH = 64
+
+    @classmethod
+    def from_fields(cls, fields: dict[str, Any]) -> UtilizationResourceField:
+        requested = cls.NONE
+        for name, member in cls.__members__.items():
+            if name.lower() in fields:
+                requested |= member
+        return requested
+
+
 def _validate_pool_type(pool_id: str, pool: Optional[Node] = None) -> Node:
-    if not pool or pool._schema.kind not in [InfrahubKind.IPADDRESSPOOL, InfrahubKind.IPPREFIXPOOL]:
+    if not pool or pool._schema.kind not in VALID_POOL_KINDS:
         raise NodeNotFoundError(node_type="ResourcePool", identifier=pool_id)
     return pool
 
@@ -137,6 +161,36 @@ class PoolAllocated(ObjectType):
         return response
 
 
+async def _resolve_utilization_edge(
+    db: InfrahubDatabase,
+    resource_id: str,
+    resource_node: Node,
+    requested: UtilizationResourceField,
+    utilization: Optional[float] = None,
+    default_branch_utilization: Optional[float] = None,
+) -> dict[str, dict[str, Union[str, float, int]]]:
+    node_response: dict[str, Union[str, float, int]] = {}
+    if requested & UtilizationResourceField.ID:
+        node_response["id"] = resource_id
+    if requested & UtilizationResourceField.KIND:
+        node_response["kind"] = resource_node.get_kind()
+    if requested & UtilizationResourceField.DISPLAY_LABEL:
+        node_response["display_label"] = await resource_node.render_display_label(db=db)
+    if requested & UtilizationResourceField.WEIGHT:
+        node_response["weight"] = await resource_node.get_resource_weight(db=db)  # type: ignore[attr-defined]
+    if requested & UtilizationResourceField.UTILIZATION and utilization is not None:
+        node_response["utilization"] = utilization
+    if requested & UtilizationResourceField.UTILIZATION_DEFAULT_BRANCH and default_branch_utilization is not None:
+        node_response["utilization_default_branch"] = default_branch_utilization
+    if (
+        requested & UtilizationResourceField.UTILIZATION_BRANCHES
+        and utilization is not None
+        and default_branch_utilization is not None
+    ):
+        node_response["utilization_branches"] = utilization - default_branch_utilization
+    return {"node": node_response}
+
+
 class PoolUtilization(ObjectType):
     count = Field(Int, required=True, description="The number of resources within the selected pool.")
     utilization = Field(Float, required=True, description="The overall utilization of the pool.")
@@ -156,71 +210,62 @@ class PoolUtilization(ObjectType):
         db: InfrahubDatabase = context.db
         pool = await NodeManager.get_one(id=pool_id, db=db, branch=context.branch)
         _validate_pool_type(pool_id=pool_id, pool=pool)
-        resources_map: dict[str, Node] = await pool.resources.get_peers(db=db, branch_agnostic=True)  # type: ignore[attr-defined,union-attr]
-        utilization_getter = PrefixUtilizationGetter(db=db, ip_prefixes=list(resources_map.values()), at=context.at)
         fields = await extract_fields_first_node(info=info)
         response: dict[str, Any] = {}
-        total_utilization = None
-        default_branch_utilization = None
+        if not UTILIZATION_FIELDS & fields.keys():
+            # Only the number of resources is requested, no need to load the resources themselves
+            if "count" in fields:
+                relationships = await pool.resources.get_relationships(db=db, branch_agnostic=True)  # type: ignore[attr-defined,union-attr]
+                response["count"] = len({rel.peer_id for rel in relationships if rel.peer_id})
+            return response
+
+        resources_map: dict[str, Node] = await pool.resources.get_peers(db=db, branch_agnostic=True)  # type: ignore[attr-defined,union-attr]
+        utilization_getter = PrefixUtilizationGetter(db=db, ip_prefixes=list(resources_map.values()), at=context.at)
         if "count" in fields:
             response["count"] = len(resources_map)
+
+        total_utilization = 0.0
+        default_branch_utilization = 0.0
+        if {"utilization", "utilization_branches"} & fields.keys():
+            total_utilization = await utilization_getter.get_use_percentage()
+        if {"utilization_default_branch", "utilization_branches"} & fields.keys():
+            default_branch_utilization = await utilization_getter.get_use_percentage(
+                branch_names=[registry.default_branch]
+            )
         if "utilization" in fields:
-            response["utilization"] = total_utilization = await utilization_getter.get_use_percentage()
+            response["utilization"] = total_utilization
         if "utilization_default_branch" in fields:
-            response["utilization_default_branch"] = (
-                default_branch_utilization
-            ) = await utilization_getter.get_use_percentage(branch_names=[registry.default_branch])
+            response["utilization_default_branch"] = default_branch_utilization
         if "utilization_branches" in fields:
-            total_utilization = (
-                total_utilization if total_utilization is not None else await utilization_getter.get_use_percentage()
-            )
-            default_branch_utilization = (
-                default_branch_utilization
-                if default_branch_utilization is not None
-                else await utilization_getter.get_use_percentage(branch_names=[registry.default_branch])
-            )
             response["utilization_branches"] = total_utilization - default_branch_utilization
         if "edges" in fields:
             response["edges"] = []
             if "node" in fields["edges"]:
-                node_fields = fields["edges"]["node"]
+                # Resolve the requested fields once instead of once per resource
+                requested = UtilizationResourceField.from_fields(fields=fields["edges"]["node"])
+                # Compute the utilization of all the resources at once instead of once per resource
+                utilization_per_resource: dict[str, float] = {}
+                default_branch_utilization_per_resource: dict[str, float] = {}
+                if requested & (UtilizationResourceField.UTILIZATION | UtilizationResourceField.UTILIZATION_BRANCHES):
+                    utilization_per_resource = await utilization_getter.get_use_percentage_per_prefix()
+                if requested & (
+                    UtilizationResourceField.UTILIZATION_DEFAULT_BRANCH | UtilizationResourceField.UTILIZATION_BRANCHES
+                ):
+                    default_branch_utilization_per_resource = await utilization_getter.get_use_percentage_per_prefix(
+                        branch_names=[registry.default_branch]
+                    )
+                # The edges are resolved one after the other, the queries share the session of the request
                 for resource_id, resource_node in resources_map.items():
-                    resource_total = None
-                    default_branch_total = None
-                    node_response: dict[str, Union[str, float, int]] = {}
-                    if "id" in node_fields:
-                        node_response["id"] = resource_id
-                    if "kind" in node_fields:
-                        node_response["kind"] = resource_node.get_kind()
-                    if "display_label" in node_fields:
-                        node_response["display_label"] = await resource_node.render_display_label(db=db)
-                    if "weight" in node_fields:
-                        node_response["weight"] = await resource_node.get_resource_weight(db=db)  # type: ignore[attr-defined]
-                    if "utilization" in node_fields:
-                        node_response["utilization"] = resource_total = await utilization_getter.get_use_percentage(
-                            ip_prefixes=[resource_node]
-                        )
-                    if "utilization_default_branch" in node_fields:
-                        node_response["utilization_default_branch"] = (
-                            default_branch_total
-                        ) = await utilization_getter.get_use_percentage(
-                            ip_prefixes=[resource_node], branch_names=[registry.default_branch]
-                        )
-                    if "utilization_branches" in node_fields:
-                        resource_total = (
-                            resource_total
-                            if resource_total is not None
-                            else await utilization_getter.get_use_percentage(ip_prefixes=[resource_node])
-                        )
-                        default_branch_total = (
-                            default_branch_total
-                            if default_branch_total is not None
-                            else await utilization_getter.get_use_percentage(
-                                ip_prefixes=[resource_node], branch_names=[registry.default_branch]
-                            )
+                    response["edges"].append(
+                        await _resolve_utilization_edge(
+                            db=db,
+                            resource_id=resource_id,
+                            resource_node=resource_node,
+                            requested=requested,
+                            utilization=utilization_per_resource.get(resource_id),
+                            default_branch_utilization=default_branch_utilization_per_resource.get(resource_id),
                         )
-                        node_response["utilization_branches"] = resource_total - default_branch_total
-                    response["edges"].append({"node": node_response})
+                    )
 
         return response
 
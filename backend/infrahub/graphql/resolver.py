@@ -236,9 +236,10 @@ async def many_relationship_resolver(
         ]
 
         entries = []
+        relation_properties = RELATIONS_PROPERTY_MAP_REVERSED.items()
         for node in node_graph:
             entry = {"node": {}, "properties": {}}
-            for key, mapped in RELATIONS_PROPERTY_MAP_REVERSED.items():
+            for key, mapped in relation_properties:
                 value = node.pop(key, None)
                 if value:
                     entry["properties"][mapped] = value
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 from .attribute import (
     AnyAttributeType,
@@ -63,13 +64,17 @@ __all__ = [
 ]
 
 
-RELATIONS_PROPERTY_MAP: Dict[str, str] = {
-    "is_visible": "_relation__is_visible",
-    "is_protected": "_relation__is_protected",
-    "owner": "_relation__owner",
-    "source": "_relation__source",
-    "updated_at": "_relation__updated_at",
-    "__typename": "__typename",
-}
+RELATIONS_PROPERTY_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "is_visible": "_relation__is_visible",
+        "is_protected": "_relation__is_protected",
+        "owner": "_relation__owner",
+        "source": "_relation__source",
+        "updated_at": "_relation__updated_at",
+        "__typename": "__typename",
+    }
+)
 
-RELATIONS_PROPERTY_MAP_REVERSED = {value: key for key, value in RELATIONS_PROPERTY_MAP.items()}
+RELATIONS_PROPERTY_MAP_REVERSED: Mapping[str, str] = MappingProxyType(
+    {value: key for key, value in RELATIONS_PROPERTY_MAP.items()}
+)
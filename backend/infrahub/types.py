@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import functools
 import importlib
 import typing
 from datetime import datetime
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Dict, Type
 from typing import List as TypingList
 
@@ -22,6 +24,13 @@ DEFAULT_MODULE_GRAPHQL_INPUT = "infrahub.graphql.mutations"
 DEFAULT_MODULE_GRAPHQL_QUERY = "infrahub.graphql.types"
 
 
+@functools.cache
+def _get_class_from_module(module_name: str, class_name: str) -> typing.Any:
+    # The classes are resolved by name to avoid circular imports, the result never changes once the module is loaded
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
 class InfrahubDataType:
     label: str
     graphql_query: str
@@ -32,11 +41,6 @@ class InfrahubDataType:
     infrahub: str
     pydantic: type
 
-    @classmethod
-    def __init_subclass__(cls, **kwargs: typing.Any):
-        super().__init_subclass__(**kwargs)
-        registry.data_type[cls.label] = cls
-
     def __str__(self) -> str:
         return self.label
 
@@ -44,29 +48,25 @@ class InfrahubDataType:
     def get_infrahub_class(cls) -> Type[BaseAttribute]:
         if not isinstance(cls.infrahub, str):
             return cls.infrahub
-        module = importlib.import_module(DEFAULT_MODULE_ATTRIBUTE)
-        return getattr(module, cls.infrahub)
+        return _get_class_from_module(DEFAULT_MODULE_ATTRIBUTE, cls.infrahub)
 
     @classmethod
     def get_graphql_create(cls) -> Type[BaseAttributeCreate]:
         if not isinstance(cls.graphql_create, str):
             return cls.graphql_create
-        module = importlib.import_module(DEFAULT_MODULE_GRAPHQL_INPUT)
-        return getattr(module, cls.graphql_create)
+        return _get_class_from_module(DEFAULT_MODULE_GRAPHQL_INPUT, cls.graphql_create)
 
     @classmethod
     def get_graphql_update(cls) -> Type[BaseAttributeUpdate]:
         if not isinstance(cls.graphql_update, str):
             return cls.graphql_update
-        module = importlib.import_module(DEFAULT_MODULE_GRAPHQL_INPUT)
-        return getattr(module, cls.graphql_update)
+        return _get_class_from_module(DEFAULT_MODULE_GRAPHQL_INPUT, cls.graphql_update)
 
     @classmethod
     def get_graphql_type(cls) -> Type[BaseAttributeType]:
         if not isinstance(cls.graphql_query, str):
             return cls.graphql_query
-        module = importlib.import_module(DEFAULT_MODULE_GRAPHQL_QUERY)
-        return getattr(module, cls.graphql_query)
+        return _get_class_from_module(DEFAULT_MODULE_GRAPHQL_QUERY, cls.graphql_query)
 
     @classmethod
     def get_graphql_type_name(cls) -> str:
@@ -123,12 +123,6 @@ class Text(InfrahubDataType):
 
 class TextArea(Text):
     label: str = "TextArea"
-    graphql = graphene.String
-    graphql_query = "TextAttributeType"
-    graphql_create = "TextAttributeCreate"
-    graphql_update = "TextAttributeUpdate"
-    graphql_filter = graphene.String
-    infrahub = "String"
 
 
 class DateTime(InfrahubDataType):
@@ -141,75 +135,35 @@ class DateTime(InfrahubDataType):
     infrahub = "DateTime"
 
 
-class Email(InfrahubDataType):
+class Email(Text):
     label: str = "Email"
-    graphql = graphene.String
-    graphql_query = "TextAttributeType"
-    graphql_create = "TextAttributeCreate"
-    graphql_update = "TextAttributeUpdate"
-    graphql_filter = graphene.String
-    infrahub = "String"
 
 
-class Password(InfrahubDataType):
+class Password(Text):
     label: str = "Password"
-    graphql = graphene.String
-    graphql_query = "TextAttributeType"
-    graphql_create = "TextAttributeCreate"
-    graphql_update = "TextAttributeUpdate"
-    graphql_filter = graphene.String
-    infrahub = "String"
     pydantic = str
 
 
-class HashedPassword(InfrahubDataType):
+class HashedPassword(Text):
     label: str = "Password"
-    graphql = graphene.String
-    graphql_query = "TextAttributeType"
-    graphql_create = "TextAttributeCreate"
-    graphql_update = "TextAttributeUpdate"
-    graphql_filter = graphene.String
     infrahub = "HashedPassword"
 
 
-class URL(InfrahubDataType):
+class URL(Text):
     label: str = "URL"
-    graphql = graphene.String
-    graphql_query = "TextAttributeType"
-    graphql_create = "TextAttributeCreate"
-    graphql_update = "TextAttributeUpdate"
-    graphql_filter = graphene.String
     infrahub = "URL"
 
 
-class File(InfrahubDataType):
+class File(Text):
     label: str = "File"
-    graphql = graphene.String
-    graphql_query = "TextAttributeType"
-    graphql_create = "TextAttributeCreate"
-    graphql_update = "TextAttributeUpdate"
-    graphql_filter = graphene.String
-    infrahub = "String"
 
 
-class MacAddress(InfrahubDataType):
+class MacAddress(Text):
     label: str = "MacAddress"
-    graphql = graphene.String
-    graphql_query = "TextAttributeType"
-    graphql_create = "TextAttributeCreate"
-    graphql_update = "TextAttributeUpdate"
-    graphql_filter = graphene.String
-    infrahub = "String"
 
 
-class Color(InfrahubDataType):
+class Color(Text):
     label: str = "Color"
-    graphql = graphene.String
-    graphql_query = "TextAttributeType"
-    graphql_create = "TextAttributeCreate"
-    graphql_update = "TextAttributeUpdate"
-    graphql_filter = graphene.String
-    infrahub = "String"
 
 
 class Dropdown(InfrahubDataType):
@@ -232,14 +186,8 @@ class Number(InfrahubDataType):
     infrahub = "Integer"
 
 
-class Bandwidth(InfrahubDataType):
+class Bandwidth(Number):
     label: str = "Bandwidth"
-    graphql = graphene.Int
-    graphql_query = "NumberAttributeType"
-    graphql_create = "NumberAttributeCreate"
-    graphql_update = "NumberAttributeUpdate"
-    graphql_filter = graphene.Int
-    infrahub = "Integer"
 
 
 class IPHost(InfrahubDataType):
@@ -272,14 +220,8 @@ class Boolean(InfrahubDataType):
     infrahub = "Boolean"
 
 
-class Checkbox(InfrahubDataType):
+class Checkbox(Boolean):
     label: str = "Checkbox"
-    graphql = graphene.Boolean
-    graphql_query = "CheckboxAttributeType"
-    graphql_create = "CheckboxAttributeCreate"
-    graphql_update = "CheckboxAttributeUpdate"
-    graphql_filter = graphene.Boolean
-    infrahub = "Boolean"
 
 
 class List(InfrahubDataType):
@@ -336,6 +278,20 @@ ATTRIBUTE_TYPES: Dict[str, Type[InfrahubDataType]] = {
     "Any": Any,
 }
 
+_DATA_TYPES: Dict[str, Type[InfrahubDataType]] = {
+    data_type.label: data_type for data_type in (Default, *ATTRIBUTE_TYPES.values())
+}
+
+# registry.data_type is a read-only view of _DATA_TYPES, not a frozen copy:
+# it follows the data types added later with register_data_type
+registry.data_type = MappingProxyType(_DATA_TYPES)
+
+
+def register_data_type(data_type: Type[InfrahubDataType]) -> None:
+    """Register a data type created after the import of this module, like the enum types of the GraphQL manager."""
+    _DATA_TYPES[data_type.label] = data_type
+
+
 ATTRIBUTE_PYTHON_TYPES: Dict[str, Type] = {
     "ID": int,  # Assuming IDs are integers
     "Dropdown": str,  # Dropdowns can be represented as strings
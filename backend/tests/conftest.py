@@ -2,6 +2,7 @@ import asyncio
 import importlib
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Any, AsyncGenerator, Generator, List, Optional, TypeVar
@@ -14,6 +15,7 @@ from infrahub import config
 from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.constants import BranchSupportType, InfrahubKind
+from infrahub.core.graph.index import node_indexes, rel_indexes
 from infrahub.core.initialization import (
     create_default_branch,
     create_global_branch,
@@ -40,8 +42,18 @@ from tests.adapters.message_bus import BusRecorder, BusSimulator
 
 BUILD_NAME = os.environ.get("INFRAHUB_BUILD_NAME", "infrahub")
 TEST_IN_DOCKER = str_to_bool(os.environ.get("INFRAHUB_TEST_IN_DOCKER", "false"))
+TEST_WITH_UVLOOP = str_to_bool(os.environ.get("INFRAHUB_TEST_UVLOOP", "false"))
 ResponseClass = TypeVar("ResponseClass")
 
+if TEST_WITH_UVLOOP:
+    # uvloop is installed with uvicorn[standard] but isn't available on all platforms
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
 
 def pytest_addoption(parser):
     parser.addoption("--neo4j", action="store_true", dest="neo4j", default=False, help="enable neo4j tests")
@@ -73,15 +85,49 @@ def event_loop():
     loop.close()
 
 
-@pytest.fixture(scope="module")
-async def db() -> AsyncGenerator[InfrahubDatabase, None]:
+def get_worker_instance_id(worker_id: str) -> int:
+    """Return the ID of the services (database, cache ...) dedicated to the current pytest-xdist worker."""
+    try:
+        return int(worker_id[2]) + 1
+    except (ValueError, IndexError):
+        return 1
+
+
+@pytest.fixture(scope="session")
+async def db(worker_id) -> AsyncGenerator[InfrahubDatabase, None]:
+    # The driver and its connection pool are shared by all the tests, the configuration
+    # must be loaded here because this fixture is created before the module scoped ones
+    config.load_and_exit()
+    if TEST_IN_DOCKER:
+        config.SETTINGS.database.address = f"{BUILD_NAME}-database-{get_worker_instance_id(worker_id)}"
+
     driver = InfrahubDatabase(driver=await get_db(retry=1))
+    # Indexes are not removed by empty_database, creating them once covers all the tests of the session
+    driver.manager.index.init(nodes=node_indexes, rels=rel_indexes)
+    await driver.manager.index.add()
 
     yield driver
 
     await driver.close()
 
 
+@pytest.fixture
+async def db_rollback(db: InfrahubDatabase) -> AsyncGenerator[InfrahubDatabase, None]:
+    """Database in transaction mode, the transaction is rolled back at the end of the test.
+
+    Only the queries executed with this object are part of the transaction, the changes
+    won't be visible to the code opening its own session from the main database object.
+    """
+    dbt = db.start_transaction()
+    transaction = await dbt.transaction()
+
+    yield dbt
+
+    await transaction.rollback()
+    session = await dbt.session()
+    await session.close()
+
+
 @pytest.fixture
 async def empty_database(db: InfrahubDatabase) -> None:
     await delete_all_nodes(db=db)
@@ -111,14 +157,14 @@ async def default_ipnamespace(db: InfrahubDatabase, register_core_models_schema)
 
 
 @pytest.fixture
-def local_storage_dir(tmp_path) -> str:
-    storage_dir = os.path.join(str(tmp_path), "storage")
-    os.mkdir(storage_dir)
+def local_storage_dir(tmp_path: Path) -> str:
+    storage_dir = tmp_path / "storage"
+    storage_dir.mkdir()
 
     config.SETTINGS.storage.driver = config.StorageDriver.FileSystemStorage
-    config.SETTINGS.storage.local.path_ = storage_dir
+    config.SETTINGS.storage.local.path_ = str(storage_dir)
 
-    return storage_dir
+    return str(storage_dir)
 
 
 @pytest.fixture
@@ -144,10 +190,7 @@ def execute_before_any_test(worker_id, tmpdir_factory):
     config.SETTINGS.storage.driver = config.StorageDriver.FileSystemStorage
 
     if TEST_IN_DOCKER:
-        try:
-            db_id = int(worker_id[2]) + 1
-        except (ValueError, IndexError):
-            db_id = 1
+        db_id = get_worker_instance_id(worker_id)
 
         config.SETTINGS.cache.address = f"{BUILD_NAME}-cache-{db_id}"
         if config.SETTINGS.cache.driver == config.CacheDriver.NATS:
@@ -469,14 +512,16 @@ class BusRPCMock(InfrahubMessageBus):
 class TestHelper:
     """TestHelper profiles functions that can be used as a fixture throughout the test framework"""
 
+    @staticmethod
+    @lru_cache
+    def _read_schema_file(file_name: str) -> str:
+        return (TestHelper.get_fixtures_dir() / "schemas" / file_name).read_text(encoding="utf-8")
+
     @staticmethod
     def schema_file(file_name: str) -> dict:
         """Return the contents of a schema file as a dictionary"""
-        file_content = Path(os.path.join(TestHelper.get_fixtures_dir(), f"schemas/{file_name}")).read_text(
-            encoding="utf-8"
-        )
-
-        return ujson.loads(file_content)
+        # Only the raw content is cached, each caller gets its own dictionary
+        return ujson.loads(TestHelper._read_schema_file(file_name))
 
     @staticmethod
     def get_fixtures_dir() -> Path:
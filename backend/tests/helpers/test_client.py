@@ -6,31 +6,49 @@ import ujson
 from fastapi import FastAPI
 from infrahub_sdk.types import HTTPMethod
 
+DUMMY_RESPONSE_CONTENT = b'{"data": {}}'
+DUMMY_REQUEST = httpx.Request(method="POST", url="http://mock")
+
 
 async def dummy_async_request(
     url: str, method: HTTPMethod, headers: Dict[str, Any], timeout: int, payload: Optional[Dict] = None
 ) -> httpx.Response:
     """Return an empty response and to pretend that the git commit was updated successfully"""
-    return httpx.Response(status_code=200, json={"data": {}}, request=httpx.Request(method="POST", url="http://mock"))
+    return httpx.Response(
+        status_code=200,
+        content=DUMMY_RESPONSE_CONTENT,
+        headers={"Content-Type": "application/json"},
+        request=DUMMY_REQUEST,
+    )
 
 
 class InfrahubTestClient(httpx.AsyncClient):
-    def __init__(self, app: FastAPI, base_url: str = ""):
-        self.loop = asyncio.get_event_loop()
-        super().__init__(app=app, base_url=base_url)
+    def __init__(
+        self,
+        app: FastAPI,
+        base_url: str = "",
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        default_headers: Optional[Dict[str, Any]] = None,
+    ):
+        # The client is created within the running loop of the tests, sync_request is submitting
+        # its requests to that loop from another thread
+        self.loop = loop or asyncio.get_running_loop()
+        self.default_headers = default_headers
+        # The transport belongs to the client and is closed along with it
+        super().__init__(transport=httpx.ASGITransport(app=app), base_url=base_url, headers=default_headers)
 
     async def _request(
         self, url: str, method: HTTPMethod, headers: Dict[str, Any], timeout: int, payload: Optional[Dict] = None
     ) -> httpx.Response:
         content = None
         if payload:
-            content = str(ujson.dumps(payload)).encode("UTF-8")
-        return await self.request(method=method.value, url=url, headers=headers, timeout=timeout, content=content)
+            content = ujson.dumps(payload).encode()
+        # Headers already defined on the client don't need to be merged again for each request
+        request_headers = headers if headers != self.default_headers else None
+        # HTTPMethod is a str Enum, it can be provided to httpx as is
+        return await self.request(method=method, url=url, headers=request_headers, timeout=timeout, content=content)
 
-    async def async_request(
-        self, url: str, method: HTTPMethod, headers: Dict[str, Any], timeout: int, payload: Optional[Dict] = None
-    ) -> httpx.Response:
-        return await self._request(url=url, method=method, headers=headers, timeout=timeout, payload=payload)
+    async_request = _request
 
     def sync_request(
         self, url: str, method: HTTPMethod, headers: Dict[str, Any], timeout: int, payload: Optional[Dict] = None
@@ -197,6 +197,7 @@ class TestIpamUtilization(TestInfrahubApp):
         assert await getter.get_use_percentage(ip_prefixes=[container]) == 100 / 8
         assert await getter.get_use_percentage(ip_prefixes=[prefix2]) == 0
         assert await getter.get_use_percentage(ip_prefixes=[prefix]) == 50.0
+        assert await getter.get_use_percentage_per_prefix() == {container.id: 100 / 8, prefix.id: 50.0, prefix2.id: 0}
 
     async def test_step01_graphql_prefix_pool_utilization(
         self, db: InfrahubDatabase, default_branch: Branch, initial_dataset
@@ -1,5 +1,10 @@
+from fastapi.encoders import jsonable_encoder
+
 from infrahub.core import registry
 from infrahub.core.constants import DiffAction
+from infrahub.core.diff.branch_differ import BranchDiffer
+from infrahub.core.diff.model import BranchDiff
+from infrahub.core.diff.payload_builder import DiffPayloadBuilder
 from infrahub.core.initialization import create_branch
 from infrahub.core.node import Node
 from infrahub.database import InfrahubDatabase
@@ -53,3 +58,30 @@ async def test_diff_data_add_node_on_another_branch(
     diffs = data["diffs"]
 
     assert len(diffs) == 0
+
+
+async def test_diff_data_matches_validated_models(
+    db: InfrahubDatabase, client, client_headers, car_person_data_generic_diff
+):
+    branch2 = car_person_data_generic_diff["branch"]
+    time_to = car_person_data_generic_diff["time30"].to_iso8601_string()
+
+    with client:
+        response = client.get(
+            f"/api/diff/data?branch=branch2&branch_only=false&time_to={time_to}",
+            headers=client_headers,
+        )
+
+    assert response.status_code == 200
+
+    # Some models of the payload are built without validation,
+    # the response must be identical to the one of a fully validated BranchDiff
+    diff = await BranchDiffer.init(
+        db=db, branch=branch2, diff_to=time_to, branch_only=False, namespaces_exclude=["Schema"]
+    )
+    schema = registry.schema.get_full(branch=branch2)
+    diff_payload_builder = DiffPayloadBuilder(db=db, diff=diff, kinds_to_include=list(schema.keys()))
+    branch_diff = await diff_payload_builder.get_branch_diff()
+    expected = BranchDiff.model_validate(branch_diff.model_dump())
+
+    assert response.json() == jsonable_encoder(expected)
@@ -1,8 +1,9 @@
+import asyncio
 import os
 import shutil
 from itertools import islice
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Union
 
 import pendulum
 import pytest
@@ -121,12 +122,34 @@ def file1_in_storage(local_storage_dir, helper) -> str:
 
     files_dir = os.path.join(fixture_dir, "schemas")
 
-    filenames = [item.name for item in os.scandir(files_dir) if item.is_file()]
-    shutil.copyfile(os.path.join(files_dir, filenames[0]), os.path.join(local_storage_dir, file1_identifier))
+    with os.scandir(files_dir) as entries:
+        file1_path = next(entry.path for entry in entries if entry.is_file())
+    shutil.copyfile(file1_path, os.path.join(local_storage_dir, file1_identifier))
 
     return file1_identifier
 
 
+async def create_and_save_node(
+    db: InfrahubDatabase, schema: Union[NodeSchema, str], branch: Branch, **kwargs: Any
+) -> Node:
+    node = await Node.init(db=db, schema=schema, branch=branch)
+    await node.new(db=db, **kwargs)
+    await node.save(db=db)
+    return node
+
+
+async def save_in_session(db: InfrahubDatabase, obj: Branch) -> None:
+    async with db.start_session() as dbs:
+        await obj.save(db=dbs)
+
+
+def build_time_params(time0: pendulum.DateTime, seconds: Iterable[int]) -> Dict[str, str]:
+    """Return time0 and a time_m<N> timestamp, N seconds before time0, for each of the requested offsets."""
+    return {"time0": time0.to_iso8601_string()} | {
+        f"time_m{nbr_sec}": time0.subtract(seconds=nbr_sec).to_iso8601_string() for nbr_sec in seconds
+    }
+
+
 @pytest.fixture
 async def simple_dataset_01(db: InfrahubDatabase, empty_database) -> dict:
     await create_default_branch(db=db)
@@ -191,20 +214,10 @@ async def base_dataset_02(db: InfrahubDatabase, default_branch: Branch, car_pers
 
     """
 
-    time0 = pendulum.now(tz="UTC")
     params = {
         "main_branch": "main",
         "branch1": "branch1",
-        "time0": time0.to_iso8601_string(),
-        "time_m10": time0.subtract(seconds=10).to_iso8601_string(),
-        "time_m20": time0.subtract(seconds=20).to_iso8601_string(),
-        "time_m25": time0.subtract(seconds=25).to_iso8601_string(),
-        "time_m30": time0.subtract(seconds=30).to_iso8601_string(),
-        "time_m35": time0.subtract(seconds=35).to_iso8601_string(),
-        "time_m40": time0.subtract(seconds=40).to_iso8601_string(),
-        "time_m45": time0.subtract(seconds=45).to_iso8601_string(),
-        "time_m50": time0.subtract(seconds=50).to_iso8601_string(),
-        "time_m60": time0.subtract(seconds=60).to_iso8601_string(),
+        **build_time_params(time0=pendulum.now(tz="UTC"), seconds=(10, 20, 25, 30, 35, 40, 45, 50, 60)),
     }
 
     # Update Main Branch and Create new Branch1
@@ -226,159 +239,151 @@ async def base_dataset_02(db: InfrahubDatabase, default_branch: Branch, car_pers
     schema_branch1 = registry.schema.get_schema_branch(name=default_branch.name).duplicate(name=branch1.name)
     registry.schema.set_schema_branch(name=branch1.name, schema=schema_branch1)
 
-    query = """
-    MATCH (root:Root)
-
-    CREATE (c1:Node:TestCar { uuid: "c1", namespace: "Test", kind: "TestCar", branch_support: "aware" })
-    CREATE (c1)-[:IS_PART_OF { branch: $main_branch, branch_level: 1, from: $time_m60, status: "active" }]->(root)
-
-    CREATE (bool_true:Boolean { value: true })
-    CREATE (bool_false:Boolean { value: false })
-
-    CREATE (atvf:AttributeValue { value: false, is_default: false  })
-    CREATE (atvt:AttributeValue { value: true, is_default: false  })
-    CREATE (atv44:AttributeValue { value: "#444444", is_default: false  })
-
-    CREATE (c1at1:Attribute { uuid: "c1at1", name: "name", branch_support: "aware"})
-    CREATE (c1at2:Attribute { uuid: "c1at2", name: "nbr_seats", branch_support: "aware"})
-    CREATE (c1at3:Attribute { uuid: "c1at3", name: "is_electric", branch_support: "aware"})
-    CREATE (c1at4:Attribute { uuid: "c1at4", name: "color", branch_support: "aware"})
-    CREATE (c1)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60}]->(c1at1)
-    CREATE (c1)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60}]->(c1at2)
-    CREATE (c1)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60}]->(c1at3)
-    CREATE (c1)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60}]->(c1at4)
-
-    CREATE (c1av11:AttributeValue { value: "accord", is_default: false })
-    CREATE (c1av12:AttributeValue { value: "volt", is_default: false })
-    CREATE (c1av21:AttributeValue { value: 5, is_default: false })
-    CREATE (c1av22:AttributeValue { value: 4, is_default: false })
-
-    CREATE (c1at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60, to: $time_m20}]->(c1av11)
-    CREATE (c1at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20 }]->(c1av12)
-    CREATE (c1at1)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(bool_false)
-    CREATE (c1at1)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(bool_true)
-
-    CREATE (c1at2)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(c1av21)
-    CREATE (c1at2)-[:HAS_VALUE {branch: $branch1, branch_level: 2, status: "active", from: $time_m20 }]->(c1av22)
-    CREATE (c1at2)-[:IS_PROTECTED {branch: $main_branch,branch_level: 1,  status: "active", from: $time_m60 }]->(bool_false)
-    CREATE (c1at2)-[:IS_PROTECTED {branch: $branch1, branch_level: 2, status: "active", from: $time_m20 }]->(bool_true)
-    CREATE (c1at2)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(bool_true)
-
-    CREATE (c1at3)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60}]->(atvt)
-    CREATE (c1at3)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(bool_false)
-    CREATE (c1at3)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(bool_true)
-
-    CREATE (c1at4)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60}]->(atv44)
-    CREATE (c1at4)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(bool_false)
-    CREATE (c1at4)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(bool_true)
-
-    CREATE (c2:Node:TestCar { uuid: "c2", namespace: "Test", kind: "TestCar", branch_support: "aware" })
-    CREATE (c2)-[:IS_PART_OF {branch: $main_branch, branch_level: 1, from: $time_m20, status: "active"}]->(root)
+    main_level = {"branch": params["main_branch"], "branch_level": 1}
+    branch1_level = {"branch": params["branch1"], "branch_level": 2}
 
-    CREATE (c2at1:Attribute { uuid: "c2at1", name: "name", branch_support: "aware"})
-    CREATE (c2at2:Attribute { uuid: "c2at2", name: "nbr_seats", branch_support: "aware"})
-    CREATE (c2at3:Attribute { uuid: "c2at3", name: "is_electric", branch_support: "aware"})
-    CREATE (c2at4:Attribute { uuid: "c2at4", name: "color", branch_support: "aware"})
-    CREATE (c2)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20}]->(c2at1)
-    CREATE (c2)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20}]->(c2at2)
-    CREATE (c2)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20}]->(c2at3)
-    CREATE (c2)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20}]->(c2at4)
-
-    CREATE (c2av11:AttributeValue { value: "odyssey", is_default: false })
-    CREATE (c2av21:AttributeValue { value: 8, is_default: false })
-
-    CREATE (c2at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20 }]->(c2av11)
-    CREATE (c2at1)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20 }]->(bool_false)
-    CREATE (c2at1)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20 }]->(bool_true)
-
-    CREATE (c2at2)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20 }]->(c2av21)
-    CREATE (c2at2)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20 }]->(bool_false)
-    CREATE (c2at2)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20 }]->(bool_true)
-
-    CREATE (c2at3)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20 }]->(atvf)
-    CREATE (c2at3)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20 }]->(bool_false)
-    CREATE (c2at3)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20 }]->(bool_true)
-
-    CREATE (c2at4)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20 }]->(atv44)
-    CREATE (c2at4)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20 }]->(bool_false)
-    CREATE (c2at4)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m20 }]->(bool_true)
-
-    CREATE (c3:Node:TestCar { uuid: "c3", namespace: "Test", kind: "TestCar", branch_support: "aware" })
-    CREATE (c3)-[:IS_PART_OF {branch: $branch1, branch_level: 2, from: $time_m40, status: "active"}]->(root)
-
-    CREATE (c3at1:Attribute { uuid: "c3at1", name: "name", branch_support: "aware"})
-    CREATE (c3at2:Attribute { uuid: "c3at2", name: "nbr_seats", branch_support: "aware"})
-    CREATE (c3at3:Attribute { uuid: "c3at3", name: "is_electric", branch_support: "aware"})
-    CREATE (c3at4:Attribute { uuid: "c3at4", name: "color", branch_support: "aware"})
-    CREATE (c3)-[:HAS_ATTRIBUTE {branch: $branch1, branch_level: 2, status: "active", from: $time_m40}]->(c3at1)
-    CREATE (c3)-[:HAS_ATTRIBUTE {branch: $branch1, branch_level: 2, status: "active", from: $time_m40}]->(c3at2)
-    CREATE (c3)-[:HAS_ATTRIBUTE {branch: $branch1, branch_level: 2, status: "active", from: $time_m40}]->(c3at3)
-    CREATE (c3)-[:HAS_ATTRIBUTE {branch: $branch1, branch_level: 2, status: "active", from: $time_m40}]->(c3at4)
-
-    CREATE (c3av11:AttributeValue { value: "volt", is_default: false })
-    CREATE (c3av21:AttributeValue { value: 4, is_default: false })
-
-    CREATE (c3at1)-[:HAS_VALUE {branch: $branch1, branch_level: 2, status: "active", from: $time_m40 }]->(c3av11)
-    CREATE (c3at1)-[:IS_PROTECTED {branch: $branch1, branch_level: 2, status: "active", from: $time_m40 }]->(bool_false)
-    CREATE (c3at1)-[:IS_VISIBLE {branch: $branch1, branch_level: 2, status: "active", from: $time_m40 }]->(bool_true)
+    cars = [
+        {"uuid": "c1", **main_level, "from": params["time_m60"]},
+        {"uuid": "c2", **main_level, "from": params["time_m20"]},
+        {"uuid": "c3", **branch1_level, "from": params["time_m40"]},
+    ]
+    persons = [{"uuid": uuid, **main_level, "from": params["time_m60"]} for uuid in ("p1", "p2", "p3")]
 
-    CREATE (c3at2)-[:HAS_VALUE {branch: $branch1, branch_level: 2, status: "active", from: $time_m40 }]->(c3av21)
-    CREATE (c3at2)-[:IS_PROTECTED {branch: $branch1, branch_level: 2, status: "active", from: $time_m40 }]->(bool_false)
-    CREATE (c3at2)-[:IS_VISIBLE {branch: $branch1, branch_level: 2, status: "active", from: $time_m40 }]->(bool_true)
+    attributes = [
+        {**car, "node": car["uuid"], "uuid": f"{car['uuid']}at{idx}", "name": name}
+        for car in cars
+        for idx, name in enumerate(("name", "nbr_seats", "is_electric", "color"), start=1)
+    ]
+    attributes += [
+        {**person, "node": person["uuid"], "uuid": f"{person['uuid']}at1", "name": "name"} for person in persons
+    ]
 
-    CREATE (c3at3)-[:HAS_VALUE {branch: $branch1, branch_level: 2, status: "active", from: $time_m40 }]->(atvf)
-    CREATE (c3at3)-[:IS_PROTECTED {branch: $branch1, branch_level: 2, status: "active", from: $time_m40 }]->(bool_false)
-    CREATE (c3at3)-[:IS_VISIBLE {branch: $branch1, branch_level: 2, status: "active", from: $time_m40 }]->(bool_true)
+    values = [
+        {"attribute": "c1at1", "value": "accord", **main_level, "from": params["time_m60"], "to": params["time_m20"]},
+        {"attribute": "c1at1", "value": "volt", **main_level, "from": params["time_m20"]},
+        {"attribute": "c1at2", "value": 5, **main_level, "from": params["time_m60"]},
+        {"attribute": "c1at2", "value": 4, **branch1_level, "from": params["time_m20"]},
+        {"attribute": "c1at3", "value": True, **main_level, "from": params["time_m60"]},
+        {"attribute": "c1at4", "value": "#444444", **main_level, "from": params["time_m60"]},
+        {"attribute": "c2at1", "value": "odyssey", **main_level, "from": params["time_m20"]},
+        {"attribute": "c2at2", "value": 8, **main_level, "from": params["time_m20"]},
+        {"attribute": "c2at3", "value": False, **main_level, "from": params["time_m20"]},
+        {"attribute": "c2at4", "value": "#444444", **main_level, "from": params["time_m20"]},
+        {"attribute": "c3at1", "value": "volt", **branch1_level, "from": params["time_m40"]},
+        {"attribute": "c3at2", "value": 4, **branch1_level, "from": params["time_m40"]},
+        {"attribute": "c3at3", "value": False, **branch1_level, "from": params["time_m40"]},
+        {"attribute": "c3at4", "value": "#444444", **branch1_level, "from": params["time_m40"]},
+        {"attribute": "p1at1", "value": "John Doe", **main_level, "from": params["time_m60"]},
+        {"attribute": "p2at1", "value": "Jane Doe", **main_level, "from": params["time_m60"]},
+        {"attribute": "p3at1", "value": "Bill", **main_level, "from": params["time_m60"]},
+    ]
 
-    CREATE (c3at4)-[:HAS_VALUE {branch: $branch1, branch_level: 2, status: "active", from: $time_m40 }]->(atv44)
-    CREATE (c3at4)-[:IS_PROTECTED {branch: $branch1, branch_level: 2, status: "active", from: $time_m40 }]->(bool_false)
-    CREATE (c3at4)-[:IS_VISIBLE {branch: $branch1, branch_level: 2, status: "active", from: $time_m40 }]->(bool_true)
+    relationships = [
+        {"uuid": "r1", "name": "testcar__testperson"},
+        {"uuid": "r2", "name": "testcar__testperson"},
+    ]
+    peers = [
+        {"node": "p1", "relationship": "r1", **main_level, "from": params["time_m60"]},
+        {"node": "c1", "relationship": "r1", **main_level, "from": params["time_m60"]},
+        {"node": "p1", "relationship": "r2", **branch1_level, "from": params["time_m20"]},
+        {"node": "c2", "relationship": "r2", **branch1_level, "from": params["time_m20"]},
+    ]
 
-    CREATE (p1:Node:TestPerson { uuid: "p1", namespace: "Test", kind: "TestPerson", branch_support: "aware" })
-    CREATE (p1)-[:IS_PART_OF { branch: $main_branch, branch_level: 1, from: $time_m60, status: "active"}]->(root)
-    CREATE (p1at1:Attribute { uuid: "p1at1", name: "name", branch_support: "aware"})
-    CREATE (p1)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60}]->(p1at1)
-    CREATE (p1av11:AttributeValue { value: "John Doe", is_default: false })
-    CREATE (p1at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(p1av11)
-    CREATE (p1at1)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(bool_false)
-    CREATE (p1at1)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(bool_true)
-
-    CREATE (p2:Node:TestPerson { uuid: "p2", namespace: "Test", kind: "TestPerson", branch_support: "aware" })
-    CREATE (p2)-[:IS_PART_OF {branch: $main_branch, branch_level: 1, from: $time_m60, status: "active"}]->(root)
-    CREATE (p2at1:Attribute { uuid: "p2at1", name: "name", branch_support: "aware"})
-    CREATE (p2)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60}]->(p2at1)
-    CREATE (p2av11:AttributeValue { value: "Jane Doe", is_default: false })
-    CREATE (p2at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(p2av11)
-    CREATE (p2at1)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(bool_false)
-    CREATE (p2at1)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(bool_true)
-
-    CREATE (p3:Node:TestPerson { uuid: "p3", namespace: "Test", kind: "TestPerson", branch_support: "aware" })
-    CREATE (p3)-[:IS_PART_OF {branch: $main_branch, branch_level: 1, from: $time_m60, status: "active"}]->(root)
-    CREATE (p3at1:Attribute { uuid: "p3at1", name: "name", branch_support: "aware"})
-    CREATE (p3)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60}]->(p3at1)
-    CREATE (p3av11:AttributeValue { value: "Bill", is_default: false })
-    CREATE (p3at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(p3av11)
-    CREATE (p3at1)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(bool_false)
-    CREATE (p3at1)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(bool_true)
+    # Every attribute is created unprotected and visible, on the same branch and at the same time as its node
+    is_protected = [
+        {
+            "source": attr["uuid"],
+            "value": False,
+            "branch": attr["branch"],
+            "branch_level": attr["branch_level"],
+            "from": attr["from"],
+        }
+        for attr in attributes
+    ]
+    is_visible = [{**flag, "value": True} for flag in is_protected]
+    is_protected += [
+        {"source": "c1at2", "value": True, **branch1_level, "from": params["time_m20"]},
+        {"source": "r1", "value": False, **main_level, "from": params["time_m60"], "to": params["time_m30"]},
+        {"source": "r1", "value": True, **main_level, "from": params["time_m30"]},
+        {"source": "r2", "value": False, **branch1_level, "from": params["time_m20"]},
+    ]
+    is_visible += [
+        {"source": "r1", "value": True, **main_level, "from": params["time_m60"]},
+        {"source": "r1", "value": False, **branch1_level, "from": params["time_m20"]},
+        {"source": "r2", "value": True, **branch1_level, "from": params["time_m20"]},
+    ]
 
-    CREATE (r1:Relationship { uuid: "r1", name: "testcar__testperson", branch_support: "aware"})
-    CREATE (p1)-[:IS_RELATED { branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(r1)
-    CREATE (c1)-[:IS_RELATED { branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(r1)
-    CREATE (r1)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60, to: $time_m30 }]->(bool_false)
-    CREATE (r1)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m30 }]->(bool_true)
-    CREATE (r1)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60 }]->(bool_true)
-    CREATE (r1)-[:IS_VISIBLE {branch: $branch1, branch_level: 2, status: "active", from: $time_m20 }]->(bool_false)
+    # Each list is written by its own UNWIND batch, WITH DISTINCT collapses the rows back to one between batches
+    query = """
+    MATCH (root:Root)
 
-    CREATE (r2:Relationship { uuid: "r2", name: "testcar__testperson", branch_support: "aware"})
-    CREATE (p1)-[:IS_RELATED { branch: $branch1, branch_level: 2, status: "active", from: $time_m20 }]->(r2)
-    CREATE (c2)-[:IS_RELATED { branch: $branch1, branch_level: 2, status: "active", from: $time_m20 }]->(r2)
-    CREATE (r2)-[:IS_PROTECTED {branch: $branch1, branch_level: 2, status: "active", from: $time_m20 }]->(bool_false)
-    CREATE (r2)-[:IS_VISIBLE {branch: $branch1, branch_level: 2, status: "active", from: $time_m20 }]->(bool_true)
+    MERGE (bool_true:Boolean { value: true })
+    MERGE (bool_false:Boolean { value: false })
 
-    RETURN c1, c2, c3
+    WITH root, bool_true, bool_false
+    UNWIND $cars AS car
+    CREATE (c:Node:TestCar { uuid: car.uuid, namespace: "Test", kind: "TestCar", branch_support: "aware" })
+    CREATE (c)-[:IS_PART_OF { branch: car.branch, branch_level: car.branch_level, from: car.from, status: "active" }]->(root)
+
+    WITH DISTINCT root, bool_true, bool_false
+    UNWIND $persons AS person
+    CREATE (p:Node:TestPerson { uuid: person.uuid, namespace: "Test", kind: "TestPerson", branch_support: "aware" })
+    CREATE (p)-[:IS_PART_OF { branch: person.branch, branch_level: person.branch_level, from: person.from, status: "active" }]->(root)
+
+    WITH DISTINCT bool_true, bool_false
+    UNWIND $attributes AS attr
+    MATCH (n:Node { uuid: attr.node })
+    CREATE (at:Attribute { uuid: attr.uuid, name: attr.name, branch_support: "aware" })
+    CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: "active", from: attr.from }]->(at)
+
+    WITH DISTINCT bool_true, bool_false
+    UNWIND $values AS val
+    MATCH (at:Attribute { uuid: val.attribute })
+    MERGE (av:AttributeValue { value: val.value, is_default: false })
+    CREATE (at)-[:HAS_VALUE { branch: val.branch, branch_level: val.branch_level, status: "active", from: val.from, to: val.to }]->(av)
+
+    WITH DISTINCT bool_true, bool_false
+    UNWIND $relationships AS rel
+    CREATE (:Relationship { uuid: rel.uuid, name: rel.name, branch_support: "aware" })
+
+    WITH DISTINCT bool_true, bool_false
+    UNWIND $peers AS peer
+    MATCH (n:Node { uuid: peer.node }), (r:Relationship { uuid: peer.relationship })
+    CREATE (n)-[:IS_RELATED { branch: peer.branch, branch_level: peer.branch_level, status: "active", from: peer.from }]->(r)
+
+    WITH DISTINCT bool_true, bool_false
+    UNWIND $is_protected AS flag
+    MATCH (src { uuid: flag.source })
+    WHERE src:Attribute OR src:Relationship
+    WITH bool_true, bool_false, src, flag, CASE WHEN flag.value THEN bool_true ELSE bool_false END AS flag_value
+    CREATE (src)-[:IS_PROTECTED {
+        branch: flag.branch, branch_level: flag.branch_level, status: "active", from: flag.from, to: flag.to
+    }]->(flag_value)
+
+    WITH DISTINCT bool_true, bool_false
+    UNWIND $is_visible AS flag
+    MATCH (src { uuid: flag.source })
+    WHERE src:Attribute OR src:Relationship
+    WITH src, flag, CASE WHEN flag.value THEN bool_true ELSE bool_false END AS flag_value
+    CREATE (src)-[:IS_VISIBLE {
+        branch: flag.branch, branch_level: flag.branch_level, status: "active", from: flag.from, to: flag.to
+    }]->(flag_value)
     """
 
-    await db.execute_query(query=query, params=params)
+    await db.execute_query(
+        query=query,
+        params={
+            **params,
+            "cars": cars,
+            "persons": persons,
+            "attributes": attributes,
+            "values": values,
+            "relationships": relationships,
+            "peers": peers,
+            "is_protected": is_protected,
+            "is_visible": is_visible,
+        },
+    )
 
     return params
 
@@ -637,16 +642,11 @@ async def base_dataset_03(db: InfrahubDatabase, default_branch: Branch, person_t
     """
 
     # ---- Create all timestamps and save them in Params -----------------
-    time0 = pendulum.now(tz="UTC")
     params = {
         "main_branch": "main",
-        "time0": time0.to_iso8601_string(),
+        **build_time_params(time0=pendulum.now(tz="UTC"), seconds=range(5, 150, 5)),
     }
 
-    for cnt in range(1, 30):
-        nbr_sec = cnt * 5
-        params[f"time_m{nbr_sec}"] = time0.subtract(seconds=nbr_sec).to_iso8601_string()
-
     # ---- Create all Branches and register them in the Registry -----------------
     # Update Main Branch
     default_branch.created_at = params["time_m120"]
@@ -660,8 +660,8 @@ async def base_dataset_03(db: InfrahubDatabase, default_branch: Branch, person_t
         ("branch4", "First Branch", "time_m40", "time_m40"),
     )
 
-    for branch_name, description, created_at, branched_from in branches:
-        obj = Branch(
+    branch_objs = [
+        Branch(
             name=branch_name,
             status="OPEN",
             description=description,
@@ -670,10 +670,14 @@ async def base_dataset_03(db: InfrahubDatabase, default_branch: Branch, person_t
             branched_from=params[branched_from],
             created_at=params[created_at],
         )
-        await obj.save(db=db)
-        registry.branch[obj.name] = obj
+        for branch_name, description, created_at, branched_from in branches
+    ]
+    # The branches are independent from each other, each one is saved concurrently in its own session
+    await asyncio.gather(*[save_in_session(db=db, obj=obj) for obj in branch_objs])
 
-        params[branch_name] = branch_name
+    for obj in branch_objs:
+        registry.branch[obj.name] = obj
+        params[obj.name] = obj.name
     # flake8: noqa: F841
     mermaid_graph = """
     gitGraph
@@ -710,244 +714,131 @@ async def base_dataset_03(db: InfrahubDatabase, default_branch: Branch, person_t
         commit id: "(m0)"
     """
 
-    query1 = """
-    // Create all branches nodes
-    MATCH (root:Root)
-
-    // Create the Boolean nodes for the properties
-    CREATE (bool_true:Boolean { value: true })
-    CREATE (bool_false:Boolean { value: false })
-
-    // Create the Boolean nodes for the attribute value
-    CREATE (atvf:AttributeValue { value: false, is_default: false })
-    CREATE (atvt:AttributeValue { value: true, is_default: false })
-
-    // Create a bunch a Attribute Value that can be easily identify and remembered
-    CREATE (mon:AttributeValue { value: "monday", is_default: false })
-    CREATE (tue:AttributeValue { value: "tuesday", is_default: false })
-    CREATE (wed:AttributeValue { value: "wednesday", is_default: false })
-    CREATE (thu:AttributeValue { value: "thursday", is_default: false })
-    CREATE (fri:AttributeValue { value: "friday", is_default: false })
-    CREATE (sat:AttributeValue { value: "saturday", is_default: false })
-    CREATE (sun:AttributeValue { value: "sunday", is_default: false })
-
-    CREATE (jan:AttributeValue { value: "january", is_default: false })
-    CREATE (feb:AttributeValue { value: "february", is_default: false })
-    CREATE (mar:AttributeValue { value: "march", is_default: false })
-    CREATE (apr:AttributeValue { value: "april", is_default: false })
-    CREATE (may:AttributeValue { value: "may", is_default: false })
-    CREATE (june:AttributeValue { value: "june", is_default: false })
-    CREATE (july:AttributeValue { value: "july", is_default: false })
-    CREATE (aug:AttributeValue { value: "august", is_default: false })
-    CREATE (sept:AttributeValue { value: "september", is_default: false })
-    CREATE (oct:AttributeValue { value: "october", is_default: false })
-    CREATE (nov:AttributeValue { value: "november", is_default: false })
-    CREATE (dec:AttributeValue { value: "december", is_default: false })
-
-    CREATE (blue:AttributeValue { value: "blue", is_default: false })
-    CREATE (red:AttributeValue { value: "red", is_default: false })
-    CREATE (black:AttributeValue { value: "black", is_default: false })
-    CREATE (green:AttributeValue { value: "green", is_default: false })
-
-    // TAG 1 - BLUE
-    CREATE (t1:Node:Tag { uuid: "t1", kind: "Tag", branch_support: "aware"})
-    CREATE (t1)-[:IS_PART_OF { branch: $main_branch, branch_level: 1, from: $time_m120, status: "active" }]->(root)
-
-    CREATE (t1at1:Attribute { uuid: "t1at1", name: "name", branch_support: "aware"})
-    CREATE (t1)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120}]->(t1at1)
-
-    CREATE (t1at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120, to: $time_m20}]->(blue)
-    CREATE (t1at1)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_false)
-    CREATE (t1at1)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_true)
-
-    // TAG 2 - RED
-    CREATE (t2:Node:Tag { uuid: "t2", kind: "Tag", branch_support: "aware" })
-    CREATE (t2)-[:IS_PART_OF { branch: $main_branch, branch_level: 1, from: $time_m120, status: "active" }]->(root)
-
-    CREATE (t2at1:Attribute { uuid: "t2at1", name: "name", branch_support: "aware"})
-    CREATE (t2)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120}]->(t2at1)
-
-    CREATE (t2at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120, to: $time_m20}]->(red)
-    CREATE (t2at1)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_false)
-    CREATE (t2at1)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_true)
-
-    // TAG 3 - GREEN
-    CREATE (t3:Node:Tag { uuid: "t3", kind: "Tag", branch_support: "aware" })
-    CREATE (t3)-[:IS_PART_OF { branch: $main_branch, branch_level: 1, from: $time_m120, status: "active" }]->(root)
-
-    CREATE (t3at1:Attribute { uuid: "t3at1", name: "name", branch_support: "aware"})
-    CREATE (t3)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120}]->(t3at1)
-
-    CREATE (t3at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120, to: $time_m20}]->(green)
-    CREATE (t3at1)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_false)
-    CREATE (t3at1)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_true)
-
-    RETURN t1, t2, t3
-    """
+    main_level = {"branch": params["main_branch"], "branch_level": 1, "from": params["time_m120"]}
+    branch2_level = {"branch": params["branch2"], "branch_level": 2}
+
+    tags = [{"uuid": uuid, **main_level} for uuid in ("t1", "t2", "t3")]
+    persons = [{"uuid": uuid, **main_level} for uuid in ("p1", "p2", "p3")]
+
+    # Each attribute is provided with all the values it had over time,
+    # the attributes of Person2 and Person3 reuse the uuids of the attributes of Person1
+    attributes = [
+        # TAGS: Blue, Red & Green
+        {"node": "t1", "uuid": "t1at1", "name": "name", "values": [{"value": "blue", "to": params["time_m20"]}]},
+        {"node": "t2", "uuid": "t2at1", "name": "name", "values": [{"value": "red", "to": params["time_m20"]}]},
+        {"node": "t3", "uuid": "t3at1", "name": "name", "values": [{"value": "green", "to": params["time_m20"]}]},
+        # PERSON 1
+        #  firstname value in main keeps changing every 20s using the day of the week
+        {
+            "node": "p1",
+            "uuid": "p1at1",
+            "name": "firstname",
+            "values": [
+                {"value": "monday", "to": params["time_m100"]},
+                {"value": "tuesday", "from": params["time_m100"], "to": params["time_m80"]},
+                {"value": "wednesday", "from": params["time_m80"], "to": params["time_m60"]},
+                {"value": "thursday", "from": params["time_m60"], "to": params["time_m40"]},
+                {"value": "friday", "from": params["time_m40"]},
+            ],
+        },
+        {"node": "p1", "uuid": "p1at2", "name": "lastname", "values": [{"value": "january"}]},
+        # PERSON 2
+        #  firstname and lastname values in branch2 changes at m80 before the branch is rebase at m30
+        #  firstname value in branch2 changes again at m20 after the branch has been rebased
+        {
+            "node": "p2",
+            "uuid": "p1at1",
+            "name": "firstname",
+            "values": [
+                {"value": "tuesday"},
+                {"value": "wednesday", **branch2_level, "from": params["time_m80"], "to": params["time_m20"]},
+                {"value": "thursday", **branch2_level, "from": params["time_m20"]},
+            ],
+        },
+        {
+            "node": "p2",
+            "uuid": "p1at2",
+            "name": "lastname",
+            "values": [{"value": "february"}, {"value": "march", **branch2_level, "from": params["time_m80"]}],
+        },
+        # PERSON 3
+        {
+            "node": "p3",
+            "uuid": "p1at1",
+            "name": "firstname",
+            "values": [{"value": "tuesday", "to": params["time_m20"]}],
+        },
+        {"node": "p3", "uuid": "p1at2", "name": "lastname", "values": [{"value": "february"}]},
+    ]
+    # Unless specified otherwise, everything is created in main at m120
+    for attr in attributes:
+        attr.update(main_level)
+        attr["values"] = [main_level | value for value in attr["values"]]
+
+    relationships = [
+        # "tags" between Person1 (p1) and Tag Blue (t1)
+        {"uuid": "relp1t1", "name": "person__tag", "peers": ["p1", "t1"], **main_level},
+        # "tags" between Person1 (p1) and Tag Green (t3)
+        {"uuid": "relp1t3", "name": "person__tag", "peers": ["p1", "t3"], **main_level},
+        # "primary_tag" between Person1 (p1) and Tag Blue (t1)
+        {"uuid": "relp1pri", "name": "person_primary_tag", "peers": ["p1", "t1"], **main_level},
+        # "tags" between Person2 (p2) and Tag Green (t3)
+        {"uuid": "relp2t3", "name": "person__tag", "peers": ["p2", "t3"], **main_level},
+        # "primary_tag" between Person3 (p3) and Tag Red (t2)
+        {"uuid": "relp3pri", "name": "person_primary_tag", "peers": ["p3", "t2"], **main_level},
+    ]
 
-    query_prefix = """
+    # Each list is written by its own UNWIND batch, WITH DISTINCT collapses the rows back to one between batches
+    # All the attributes and relationships are unprotected and visible since their creation
+    query = """
     MATCH (root:Root)
 
-    MATCH (t1:Tag {uuid: "t1"})
-    MATCH (t2:Tag {uuid: "t2"})
-    MATCH (t3:Tag {uuid: "t3"})
-
-    // Create the Boolean nodes for the properties
     MERGE (bool_true:Boolean { value: true })
     MERGE (bool_false:Boolean { value: false })
 
-    // Create the Boolean nodes for the attribute value
-    MERGE (atvf:AttributeValue { value: false, is_default: false  })
-    MERGE (atvt:AttributeValue { value: true, is_default: false  })
-
-    // Create a bunch a Attribute Value that can be easily identify and remembered
-    MERGE (mon:AttributeValue { value: "monday", is_default: false })
-    MERGE (tue:AttributeValue { value: "tuesday", is_default: false })
-    MERGE (wed:AttributeValue { value: "wednesday", is_default: false })
-    MERGE (thu:AttributeValue { value: "thursday", is_default: false })
-    MERGE (fri:AttributeValue { value: "friday", is_default: false })
-    MERGE (sat:AttributeValue { value: "saturday", is_default: false })
-    MERGE (sun:AttributeValue { value: "sunday", is_default: false })
-
-    MERGE (jan:AttributeValue { value: "january", is_default: false })
-    MERGE (feb:AttributeValue { value: "february", is_default: false })
-    MERGE (mar:AttributeValue { value: "march", is_default: false })
-    MERGE (apr:AttributeValue { value: "april", is_default: false })
-    MERGE (may:AttributeValue { value: "may", is_default: false })
-    MERGE (june:AttributeValue { value: "june", is_default: false })
-    MERGE (july:AttributeValue { value: "july", is_default: false })
-    MERGE (aug:AttributeValue { value: "august", is_default: false })
-    MERGE (sept:AttributeValue { value: "september", is_default: false })
-    MERGE (oct:AttributeValue { value: "october", is_default: false })
-    MERGE (nov:AttributeValue { value: "november", is_default: false })
-    MERGE (dec:AttributeValue { value: "december", is_default: false })
-    """
-
-    query2 = """
-    // PERSON 1
-    //  Created in the main branch at m120
-    //    tags: Blue, Green
-    //    primary Tag: Blue
-    //  firstname value in main keeps changing every 20s using the day of the week
-
-    CREATE (p1:Node:Person { uuid: "p1", kind: "Person", branch_support: "aware" })
-    CREATE (p1)-[:IS_PART_OF { branch: $main_branch, branch_level: 1, from: $time_m120, status: "active" }]->(root)
-
-    CREATE (p1at1:Attribute { uuid: "p1at1", name: "firstname", branch_support: "aware"})
-    CREATE (p1at2:Attribute { uuid: "p1at2", name: "lastname", branch_support: "aware"})
-    CREATE (p1)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120}]->(p1at1)
-    CREATE (p1)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120}]->(p1at2)
-
-    CREATE (p1at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120, to: $time_m100 }]->(mon)
-    CREATE (p1at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m100, to: $time_m80 }]->(tue)
-    CREATE (p1at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m80, to: $time_m60 }]->(wed)
-    CREATE (p1at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m60, to: $time_m40 }]->(thu)
-    CREATE (p1at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m40 }]->(fri)
-    CREATE (p1at1)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_false)
-    CREATE (p1at1)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_true)
-
-    CREATE (p1at2)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(jan)
-    CREATE (p1at2)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_false)
-    CREATE (p1at2)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_true)
-
-    // Relationship for "tags" between Person1 (p1) and Tag Blue (t1) >> relp1t1
-    CREATE (relp1t1:Relationship { uuid: "relp1t1", name: "person__tag", branch_support: "aware"})
-    CREATE (p1)-[:IS_RELATED { branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(relp1t1)
-    CREATE (t1)-[:IS_RELATED { branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(relp1t1)
-
-    CREATE (relp1t1)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_false)
-    CREATE (relp1t1)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_true)
-
-    // Relationship for "tags" between Person1 (p1) and Tag Green (t3) >> relp1t3
-    CREATE (relp1t3:Relationship { uuid: "relp1t3", name: "person__tag", branch_support: "aware"})
-    CREATE (p1)-[:IS_RELATED { branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(relp1t3)
-    CREATE (t3)-[:IS_RELATED { branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(relp1t3)
-
-    CREATE (relp1t3)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_false)
-    CREATE (relp1t3)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_true)
-
-    // Relationship for "primary_tag" between Person1 (p1) and Tag Blue (t1) >> relp1pri
-    CREATE (relp1pri:Relationship { uuid: "relp1pri", name: "person_primary_tag", branch_support: "aware"})
-    CREATE (p1)-[:IS_RELATED { branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(relp1pri)
-    CREATE (t1)-[:IS_RELATED { branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(relp1pri)
-
-    CREATE (relp1pri)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_false)
-    CREATE (relp1pri)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_true)
+    WITH root, bool_true, bool_false
+    UNWIND $tags AS tag
+    CREATE (t:Node:Tag { uuid: tag.uuid, kind: "Tag", branch_support: "aware" })
+    CREATE (t)-[:IS_PART_OF { branch: tag.branch, branch_level: tag.branch_level, from: tag.from, status: "active" }]->(root)
+
+    WITH DISTINCT root, bool_true, bool_false
+    UNWIND $persons AS person
+    CREATE (p:Node:Person { uuid: person.uuid, kind: "Person", branch_support: "aware" })
+    CREATE (p)-[:IS_PART_OF { branch: person.branch, branch_level: person.branch_level, from: person.from, status: "active" }]->(root)
+
+    WITH DISTINCT bool_true, bool_false
+    UNWIND $attributes AS attr
+    MATCH (n:Node { uuid: attr.node })
+    CREATE (at:Attribute { uuid: attr.uuid, name: attr.name, branch_support: "aware" })
+    CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: "active", from: attr.from }]->(at)
+    CREATE (at)-[:IS_PROTECTED { branch: attr.branch, branch_level: attr.branch_level, status: "active", from: attr.from }]->(bool_false)
+    CREATE (at)-[:IS_VISIBLE { branch: attr.branch, branch_level: attr.branch_level, status: "active", from: attr.from }]->(bool_true)
+    WITH bool_true, bool_false, at, attr
+    UNWIND attr.values AS val
+    MERGE (av:AttributeValue { value: val.value, is_default: false })
+    CREATE (at)-[:HAS_VALUE { branch: val.branch, branch_level: val.branch_level, status: "active", from: val.from, to: val.to }]->(av)
+
+    WITH DISTINCT bool_true, bool_false
+    UNWIND $relationships AS rel
+    CREATE (r:Relationship { uuid: rel.uuid, name: rel.name, branch_support: "aware" })
+    CREATE (r)-[:IS_PROTECTED { branch: rel.branch, branch_level: rel.branch_level, status: "active", from: rel.from }]->(bool_false)
+    CREATE (r)-[:IS_VISIBLE { branch: rel.branch, branch_level: rel.branch_level, status: "active", from: rel.from }]->(bool_true)
+    WITH r, rel
+    UNWIND rel.peers AS peer_id
+    MATCH (peer:Node { uuid: peer_id })
+    CREATE (peer)-[:IS_RELATED { branch: rel.branch, branch_level: rel.branch_level, status: "active", from: rel.from }]->(r)
     """
 
-    query3 = """
-    // PERSON 2
-    //  Created in the main branch at m120
-    //    tags: Green
-    //    primary Tag: None
-    //  firstname and lastname values in branch2 changes at m80 before the branch is rebase at m30
-    //  firstname value in branch2 changes again at m20 after the branch has been rebased
-
-    CREATE (p2:Node:Person { uuid: "p2", kind: "Person", branch_support: "aware" })
-    CREATE (p2)-[:IS_PART_OF { branch: $main_branch, branch_level: 1, from: $time_m120, status: "active" }]->(root)
-
-    CREATE (p2at1:Attribute { uuid: "p1at1", name: "firstname", branch_support: "aware"})
-    CREATE (p2at2:Attribute { uuid: "p1at2", name: "lastname", branch_support: "aware"})
-    CREATE (p2)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120}]->(p2at1)
-    CREATE (p2)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120}]->(p2at2)
-
-    CREATE (p2at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(tue)
-    CREATE (p2at1)-[:HAS_VALUE {branch: $branch2, branch_level: 2, status: "active", from: $time_m80, to: $time_m20 }]->(wed)
-    CREATE (p2at1)-[:HAS_VALUE {branch: $branch2, branch_level: 2, status: "active", from: $time_m20 }]->(thu)
-
-    CREATE (p2at1)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_false)
-    CREATE (p2at1)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_true)
-
-    CREATE (p2at2)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(feb)
-    CREATE (p2at2)-[:HAS_VALUE {branch: $branch2, branch_level: 2, status: "active", from: $time_m80 }]->(mar)
-    CREATE (p2at2)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_false)
-    CREATE (p2at2)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_true)
-
-    // Relationship for "tags" between Person2 (p2) and Tag Green (t3) >> relp2t3
-    CREATE (relp2t3:Relationship { uuid: "relp2t3", name: "person__tag", branch_support: "aware"})
-    CREATE (p2)-[:IS_RELATED { branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(relp2t3)
-    CREATE (t3)-[:IS_RELATED { branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(relp2t3)
-
-    CREATE (relp2t3)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_false)
-    CREATE (relp2t3)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_true)
-    """
-
-    query4 = """
-    // PERSON 3
-    //  Created in the main branch at m120
-    //    tags: None
-    //    primary Tag: Red
-
-    CREATE (p3:Node:Person { uuid: "p3", kind: "Person", branch_support: "aware" })
-    CREATE (p3)-[:IS_PART_OF { branch: $main_branch, branch_level: 1, from: $time_m120, status: "active" }]->(root)
-
-    CREATE (p3at1:Attribute { uuid: "p1at1", name: "firstname", branch_support: "aware"})
-    CREATE (p3at2:Attribute { uuid: "p1at2", name: "lastname", branch_support: "aware"})
-    CREATE (p3)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120}]->(p3at1)
-    CREATE (p3)-[:HAS_ATTRIBUTE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120}]->(p3at2)
-
-    CREATE (p3at1)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120, to: $time_m20}]->(tue)
-    CREATE (p3at1)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_false)
-    CREATE (p3at1)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_true)
-
-    CREATE (p3at2)-[:HAS_VALUE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(feb)
-    CREATE (p3at2)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_false)
-    CREATE (p3at2)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_true)
-
-    // Relationship for "primary_tag" between Person3 (p3) and Tag Red (t2) >> relp3pri
-    CREATE (relp3pri:Relationship { uuid: "relp3pri", name: "person_primary_tag", branch_support: "aware"})
-    CREATE (p1)-[:IS_RELATED { branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(relp3pri)
-    CREATE (t1)-[:IS_RELATED { branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(relp3pri)
-
-    CREATE (relp3pri)-[:IS_PROTECTED {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_false)
-    CREATE (relp3pri)-[:IS_VISIBLE {branch: $main_branch, branch_level: 1, status: "active", from: $time_m120 }]->(bool_true)
-
-    RETURN t1, t2, t3
-    """
-    await db.execute_query(query=query1, params=params)
-    await db.execute_query(query=query_prefix + query2, params=params)
-    await db.execute_query(query=query_prefix + query3, params=params)
-    await db.execute_query(query=query_prefix + query4, params=params)
+    await db.execute_query(
+        query=query,
+        params={
+            **params,
+            "tags": tags,
+            "persons": persons,
+            "attributes": attributes,
+            "relationships": relationships,
+        },
+    )
     return params
 
 
@@ -1097,25 +988,6 @@ async def car_person_schema_global(
 
 @pytest.fixture
 async def car_person_data_generic(db: InfrahubDatabase, register_core_models_schema, car_person_schema_generics):
-    p1 = await Node.init(db=db, schema="TestPerson")
-    await p1.new(db=db, name="John", height=180)
-    await p1.save(db=db)
-    p2 = await Node.init(db=db, schema="TestPerson")
-    await p2.new(db=db, name="Jane", height=170)
-    await p2.save(db=db)
-    c1 = await Node.init(db=db, schema="TestElectricCar")
-    await c1.new(db=db, name="volt", nbr_seats=3, nbr_engine=4, owner=p1)
-    await c1.save(db=db)
-    c2 = await Node.init(db=db, schema="TestElectricCar")
-    await c2.new(db=db, name="bolt", nbr_seats=2, nbr_engine=2, owner=p1)
-    await c2.save(db=db)
-    c3 = await Node.init(db=db, schema="TestGazCar")
-    await c3.new(db=db, name="nolt", nbr_seats=4, mpg=25, owner=p2)
-    await c3.save(db=db)
-    c4 = await Node.init(db=db, schema="TestGazCar")
-    await c4.new(db=db, name="focus", nbr_seats=5, mpg=30, owner=p2)
-    await c4.save(db=db)
-
     query = """
     query {
         TestPerson {
@@ -1131,13 +1003,34 @@ async def car_person_data_generic(db: InfrahubDatabase, register_core_models_sch
     }
     """
 
-    q1 = await Node.init(db=db, schema=InfrahubKind.GRAPHQLQUERY)
-    await q1.new(db=db, name="query01", query=query)
-    await q1.save(db=db)
-
-    r1 = await Node.init(db=db, schema=InfrahubKind.REPOSITORY)
-    await r1.new(db=db, name="repo01", location="git@github.com:user/repo01.git", commit="aaaaaaaaa")
-    await r1.save(db=db)
+    # All the nodes are created in one transaction, the whole dataset is committed at once
+    async with db.start_transaction() as dbt:
+        p1 = await Node.init(db=dbt, schema="TestPerson")
+        await p1.new(db=dbt, name="John", height=180)
+        await p1.save(db=dbt)
+        p2 = await Node.init(db=dbt, schema="TestPerson")
+        await p2.new(db=dbt, name="Jane", height=170)
+        await p2.save(db=dbt)
+        c1 = await Node.init(db=dbt, schema="TestElectricCar")
+        await c1.new(db=dbt, name="volt", nbr_seats=3, nbr_engine=4, owner=p1)
+        await c1.save(db=dbt)
+        c2 = await Node.init(db=dbt, schema="TestElectricCar")
+        await c2.new(db=dbt, name="bolt", nbr_seats=2, nbr_engine=2, owner=p1)
+        await c2.save(db=dbt)
+        c3 = await Node.init(db=dbt, schema="TestGazCar")
+        await c3.new(db=dbt, name="nolt", nbr_seats=4, mpg=25, owner=p2)
+        await c3.save(db=dbt)
+        c4 = await Node.init(db=dbt, schema="TestGazCar")
+        await c4.new(db=dbt, name="focus", nbr_seats=5, mpg=30, owner=p2)
+        await c4.save(db=dbt)
+
+        q1 = await Node.init(db=dbt, schema=InfrahubKind.GRAPHQLQUERY)
+        await q1.new(db=dbt, name="query01", query=query)
+        await q1.save(db=dbt)
+
+        r1 = await Node.init(db=dbt, schema=InfrahubKind.REPOSITORY)
+        await r1.new(db=dbt, name="repo01", location="git@github.com:user/repo01.git", commit="aaaaaaaaa")
+        await r1.save(db=dbt)
 
     return {
         "p1": p1,
@@ -1332,22 +1225,23 @@ async def car_person_generics_data(db: InfrahubDatabase, car_person_schema_gener
     gcar = registry.schema.get(name="TestGazCar")
     person = registry.schema.get(name="TestPerson")
 
-    p1 = await Node.init(db=db, schema=person)
-    await p1.new(db=db, name="John", height=180)
-    await p1.save(db=db)
-    p2 = await Node.init(db=db, schema=person)
-    await p2.new(db=db, name="Jane", height=170)
-    await p2.save(db=db)
-
-    c1 = await Node.init(db=db, schema=ecar)
-    await c1.new(db=db, name="volt", nbr_seats=4, nbr_engine=4, owner=p1)
-    await c1.save(db=db)
-    c2 = await Node.init(db=db, schema=ecar)
-    await c2.new(db=db, name="bolt", nbr_seats=4, nbr_engine=2, owner=p1)
-    await c2.save(db=db)
-    c3 = await Node.init(db=db, schema=gcar)
-    await c3.new(db=db, name="nolt", nbr_seats=4, mpg=25, owner=p2)
-    await c3.save(db=db)
+    async with db.start_transaction() as dbt:
+        p1 = await Node.init(db=dbt, schema=person)
+        await p1.new(db=dbt, name="John", height=180)
+        await p1.save(db=dbt)
+        p2 = await Node.init(db=dbt, schema=person)
+        await p2.new(db=dbt, name="Jane", height=170)
+        await p2.save(db=dbt)
+
+        c1 = await Node.init(db=dbt, schema=ecar)
+        await c1.new(db=dbt, name="volt", nbr_seats=4, nbr_engine=4, owner=p1)
+        await c1.save(db=dbt)
+        c2 = await Node.init(db=dbt, schema=ecar)
+        await c2.new(db=dbt, name="bolt", nbr_seats=4, nbr_engine=2, owner=p1)
+        await c2.save(db=dbt)
+        c3 = await Node.init(db=dbt, schema=gcar)
+        await c3.new(db=dbt, name="nolt", nbr_seats=4, mpg=25, owner=p2)
+        await c3.save(db=dbt)
 
     nodes = {
         "p1": p1,
@@ -1403,137 +1297,132 @@ async def person_tag_schema(db: InfrahubDatabase, default_branch: Branch, data_s
 
 @pytest.fixture
 async def person_john_main(db: InfrahubDatabase, default_branch: Branch, car_person_schema) -> Node:
-    person = await Node.init(db=db, schema="TestPerson", branch=default_branch)
-    await person.new(db=db, name="John", height=180)
-    await person.save(db=db)
-
-    return person
+    return await create_and_save_node(db=db, schema="TestPerson", branch=default_branch, name="John", height=180)
 
 
 @pytest.fixture
 async def person_jane_main(db: InfrahubDatabase, default_branch: Branch, car_person_schema) -> Node:
-    person = await Node.init(db=db, schema="TestPerson", branch=default_branch)
-    await person.new(db=db, name="Jane", height=180)
-    await person.save(db=db)
-
-    return person
+    return await create_and_save_node(db=db, schema="TestPerson", branch=default_branch, name="Jane", height=180)
 
 
 @pytest.fixture
 async def person_jim_main(db: InfrahubDatabase, default_branch: Branch, car_person_schema) -> Node:
-    person = await Node.init(db=db, schema="TestPerson", branch=default_branch)
-    await person.new(db=db, name="Jim", height=170)
-    await person.save(db=db)
-
-    return person
+    return await create_and_save_node(db=db, schema="TestPerson", branch=default_branch, name="Jim", height=170)
 
 
 @pytest.fixture
 async def person_albert_main(db: InfrahubDatabase, default_branch: Branch, car_person_schema) -> Node:
-    person = await Node.init(db=db, schema="TestPerson", branch=default_branch)
-    await person.new(db=db, name="Albert", height=160)
-    await person.save(db=db)
-
-    return person
+    return await create_and_save_node(db=db, schema="TestPerson", branch=default_branch, name="Albert", height=160)
 
 
 @pytest.fixture
 async def person_alfred_main(db: InfrahubDatabase, default_branch: Branch, car_person_schema) -> Node:
-    person = await Node.init(db=db, schema="TestPerson", branch=default_branch)
-    await person.new(db=db, name="Alfred", height=160)
-    await person.save(db=db)
-
-    return person
+    return await create_and_save_node(db=db, schema="TestPerson", branch=default_branch, name="Alfred", height=160)
 
 
 @pytest.fixture
 async def car_profile1_main(db: InfrahubDatabase, default_branch: Branch, car_person_schema) -> Node:
-    profile = await Node.init(db=db, schema="ProfileTestCar", branch=default_branch)
-    await profile.new(db=db, profile_name="car-profile1", nbr_seats=5, is_electric=False)
-    await profile.save(db=db)
-
-    return profile
+    return await create_and_save_node(
+        db=db,
+        schema="ProfileTestCar",
+        branch=default_branch,
+        profile_name="car-profile1",
+        nbr_seats=5,
+        is_electric=False,
+    )
 
 
 @pytest.fixture
 async def car_accord_main(db: InfrahubDatabase, default_branch: Branch, person_john_main: Node) -> Node:
-    car = await Node.init(db=db, schema="TestCar", branch=default_branch)
-    await car.new(db=db, name="accord", nbr_seats=5, is_electric=False, owner=person_john_main.id)
-    await car.save(db=db)
-
-    return car
+    return await create_and_save_node(
+        db=db,
+        schema="TestCar",
+        branch=default_branch,
+        name="accord",
+        nbr_seats=5,
+        is_electric=False,
+        owner=person_john_main.id,
+    )
 
 
 @pytest.fixture
 async def car_volt_main(db: InfrahubDatabase, default_branch: Branch, person_john_main: Node) -> Node:
-    car = await Node.init(db=db, schema="TestCar", branch=default_branch)
-    await car.new(db=db, name="volt", nbr_seats=4, is_electric=True, owner=person_john_main.id)
-    await car.save(db=db)
-
-    return car
+    return await create_and_save_node(
+        db=db,
+        schema="TestCar",
+        branch=default_branch,
+        name="volt",
+        nbr_seats=4,
+        is_electric=True,
+        owner=person_john_main.id,
+    )
 
 
 @pytest.fixture
 async def car_prius_main(db: InfrahubDatabase, default_branch: Branch, person_john_main: Node) -> Node:
-    car = await Node.init(db=db, schema="TestCar", branch=default_branch)
-    await car.new(db=db, name="prius", nbr_seats=5, is_electric=True, owner=person_john_main.id)
-    await car.save(db=db)
-
-    return car
+    return await create_and_save_node(
+        db=db,
+        schema="TestCar",
+        branch=default_branch,
+        name="prius",
+        nbr_seats=5,
+        is_electric=True,
+        owner=person_john_main.id,
+    )
 
 
 @pytest.fixture
 async def car_camry_main(db: InfrahubDatabase, default_branch: Branch, person_jane_main: Node) -> Node:
-    car = await Node.init(db=db, schema="TestCar", branch=default_branch)
-    await car.new(db=db, name="camry", nbr_seats=5, is_electric=False, owner=person_jane_main.id)
-    await car.save(db=db)
-
-    return car
+    return await create_and_save_node(
+        db=db,
+        schema="TestCar",
+        branch=default_branch,
+        name="camry",
+        nbr_seats=5,
+        is_electric=False,
+        owner=person_jane_main.id,
+    )
 
 
 @pytest.fixture
 async def car_yaris_main(db: InfrahubDatabase, default_branch: Branch, person_jane_main: Node) -> Node:
-    car = await Node.init(db=db, schema="TestCar", branch=default_branch)
-    await car.new(db=db, name="yaris", nbr_seats=4, is_electric=False, owner=person_jane_main.id)
-    await car.save(db=db)
-
-    return car
+    return await create_and_save_node(
+        db=db,
+        schema="TestCar",
+        branch=default_branch,
+        name="yaris",
+        nbr_seats=4,
+        is_electric=False,
+        owner=person_jane_main.id,
+    )
 
 
 @pytest.fixture
 async def tag_blue_main(db: InfrahubDatabase, default_branch: Branch, person_tag_schema) -> Node:
-    tag = await Node.init(db=db, schema=InfrahubKind.TAG, branch=default_branch)
-    await tag.new(db=db, name="Blue", description="The Blue tag")
-    await tag.save(db=db)
-
-    return tag
+    return await create_and_save_node(
+        db=db, schema=InfrahubKind.TAG, branch=default_branch, name="Blue", description="The Blue tag"
+    )
 
 
 @pytest.fixture
 async def tag_red_main(db: InfrahubDatabase, default_branch: Branch, person_tag_schema) -> Node:
-    tag = await Node.init(db=db, schema=InfrahubKind.TAG, branch=default_branch)
-    await tag.new(db=db, name="Red", description="The Red tag")
-    await tag.save(db=db)
-
-    return tag
+    return await create_and_save_node(
+        db=db, schema=InfrahubKind.TAG, branch=default_branch, name="Red", description="The Red tag"
+    )
 
 
 @pytest.fixture
 async def tag_black_main(db: InfrahubDatabase, default_branch: Branch, person_tag_schema) -> Node:
-    tag = await Node.init(db=db, schema=InfrahubKind.TAG, branch=default_branch)
-    await tag.new(db=db, name="Black", description="The Black tag")
-    await tag.save(db=db)
-
-    return tag
+    return await create_and_save_node(
+        db=db, schema=InfrahubKind.TAG, branch=default_branch, name="Black", description="The Black tag"
+    )
 
 
 @pytest.fixture
 async def person_jack_main(db: InfrahubDatabase, default_branch: Branch, person_tag_schema) -> Node:
-    obj = await Node.init(db=db, schema="TestPerson", branch=default_branch)
-    await obj.new(db=db, firstname="Jack", lastname="Russell")
-    await obj.save(db=db)
-
-    return obj
+    return await create_and_save_node(
+        db=db, schema="TestPerson", branch=default_branch, firstname="Jack", lastname="Russell"
+    )
 
 
 @pytest.fixture
@@ -1574,11 +1463,13 @@ async def group_group1_members_main(
     person_john_main: Node,
     person_jim_main: Node,
 ) -> Node:
-    obj = await Node.init(db=db, schema=InfrahubKind.STANDARDGROUP, branch=default_branch)
-    await obj.new(db=db, name="group1", members=[person_john_main, person_jim_main])
-    await obj.save(db=db)
-
-    return obj
+    return await create_and_save_node(
+        db=db,
+        schema=InfrahubKind.STANDARDGROUP,
+        branch=default_branch,
+        name="group1",
+        members=[person_john_main, person_jim_main],
+    )
 
 
 @pytest.fixture
@@ -1589,11 +1480,13 @@ async def group_group2_members_main(
     person_john_main: Node,
     person_albert_main: Node,
 ) -> Node:
-    obj = await Node.init(db=db, schema=InfrahubKind.STANDARDGROUP, branch=default_branch)
-    await obj.new(db=db, name="group2", members=[person_john_main, person_albert_main])
-    await obj.save(db=db)
-
-    return obj
+    return await create_and_save_node(
+        db=db,
+        schema=InfrahubKind.STANDARDGROUP,
+        branch=default_branch,
+        name="group2",
+        members=[person_john_main, person_albert_main],
+    )
 
 
 @pytest.fixture
@@ -1605,11 +1498,13 @@ async def group_group1_subscribers_main(
     person_jim_main: Node,
     person_albert_main: Node,
 ) -> Node:
-    obj = await Node.init(db=db, schema=InfrahubKind.STANDARDGROUP, branch=default_branch)
-    await obj.new(db=db, name="group1", subscribers=[person_john_main, person_jim_main, person_albert_main])
-    await obj.save(db=db)
-
-    return obj
+    return await create_and_save_node(
+        db=db,
+        schema=InfrahubKind.STANDARDGROUP,
+        branch=default_branch,
+        name="group1",
+        subscribers=[person_john_main, person_jim_main, person_albert_main],
+    )
 
 
 @pytest.fixture
@@ -1622,11 +1517,13 @@ async def group_group2_subscribers_main(
     car_volt_main: Node,
     car_accord_main: Node,
 ) -> Node:
-    obj = await Node.init(db=db, schema=InfrahubKind.STANDARDGROUP, branch=default_branch)
-    await obj.new(db=db, name="group2", subscribers=[person_john_main, person_jim_main, car_volt_main, car_accord_main])
-    await obj.save(db=db)
-
-    return obj
+    return await create_and_save_node(
+        db=db,
+        schema=InfrahubKind.STANDARDGROUP,
+        branch=default_branch,
+        name="group2",
+        subscribers=[person_john_main, person_jim_main, car_volt_main, car_accord_main],
+    )
 
 
 @pytest.fixture
@@ -1729,27 +1626,33 @@ async def criticality_schema(db: InfrahubDatabase, default_branch: Branch, group
 
 @pytest.fixture
 async def criticality_low(db: InfrahubDatabase, default_branch: Branch, criticality_schema: NodeSchema):
-    obj = await Node.init(db=db, schema=criticality_schema)
-    await obj.new(db=db, name="low", level=4)
-    await obj.save(db=db)
-
-    return obj
+    return await create_and_save_node(db=db, schema=criticality_schema, branch=default_branch, name="low", level=4)
 
 
 @pytest.fixture
 async def criticality_medium(db: InfrahubDatabase, default_branch: Branch, criticality_schema: NodeSchema):
-    obj = await Node.init(db=db, schema=criticality_schema)
-    await obj.new(db=db, name="medium", level=3, description="My desc", color="#333333")
-    await obj.save(db=db)
-    return obj
+    return await create_and_save_node(
+        db=db,
+        schema=criticality_schema,
+        branch=default_branch,
+        name="medium",
+        level=3,
+        description="My desc",
+        color="#333333",
+    )
 
 
 @pytest.fixture
 async def criticality_high(db: InfrahubDatabase, default_branch: Branch, criticality_schema: NodeSchema):
-    obj = await Node.init(db=db, schema=criticality_schema)
-    await obj.new(db=db, name="high", level=2, description="My other desc", color="#333333")
-    await obj.save(db=db)
-    return obj
+    return await create_and_save_node(
+        db=db,
+        schema=criticality_schema,
+        branch=default_branch,
+        name="high",
+        level=2,
+        description="My other desc",
+        color="#333333",
+    )
 
 
 @pytest.fixture
@@ -1780,11 +1683,11 @@ async def car_schema(db: InfrahubDatabase, default_branch: Branch, generic_vehic
         ],
     }
 
+    # The attributes and relationships of TestVehicule are inherited while processing the schema branch
     node = NodeSchema(**SCHEMA)
-    node.inherit_from_interface(interface=generic_vehicule_schema)
     registry.schema.set(name=node.kind, schema=node)
     registry.schema.process_schema_branch(name=default_branch.name)
-    return node
+    return registry.schema.get(name=node.kind, branch=default_branch.name)
 
 
 @pytest.fixture
@@ -1839,11 +1742,11 @@ async def boat_schema(
         ],
     }
 
+    # The attributes and relationships of TestVehicule are inherited while processing the schema branch
     node = NodeSchema(**SCHEMA)
-    node.inherit_from_interface(interface=generic_vehicule_schema)
     registry.schema.set(name=node.kind, schema=node)
     registry.schema.process_schema_branch(name=default_branch.name)
-    return node
+    return registry.schema.get(name=node.kind, branch=default_branch.name)
 
 
 @pytest.fixture
@@ -2368,9 +2271,9 @@ async def register_organization_schema(default_branch: Branch, organization_sche
 
 @pytest.fixture
 async def register_core_schema_db(db: InfrahubDatabase, default_branch: Branch, register_core_models_schema) -> None:
+    # load_schema_to_db stores the IDs of the new schema nodes in the schema branch, no need to read it back
     await registry.schema.load_schema_to_db(schema=register_core_models_schema, branch=default_branch, db=db)
-    updated_schema = await registry.schema.load_schema_from_db(db=db, branch=default_branch)
-    registry.schema.set_schema_branch(name=default_branch.name, schema=updated_schema)
+    registry.schema.set_schema_branch(name=default_branch.name, schema=register_core_models_schema)
 
 
 @pytest.fixture
@@ -2499,52 +2402,54 @@ async def second_account(db: InfrahubDatabase, data_schema, node_group_schema, r
 
 @pytest.fixture
 async def repos_in_main(db: InfrahubDatabase, register_core_models_schema):
-    repo01 = await Node.init(db=db, schema=InfrahubKind.REPOSITORY)
-    await repo01.new(
-        db=db,
-        name="repo01",
-        description="Repo 01 initial value",
-        location="git@github.com:user/repo01.git",
-        commit="aaaaaaaaaaa",
-    )
-    await repo01.save(db=db)
-
-    repo02 = await Node.init(db=db, schema=InfrahubKind.REPOSITORY)
-    await repo02.new(
-        db=db,
-        name="repo02",
-        description="Repo 02 initial value",
-        location="git@github.com:user/repo02.git",
-        commit="bbbbbbbbbbb",
-    )
-    await repo02.save(db=db)
+    async with db.start_transaction() as dbt:
+        repo01 = await Node.init(db=dbt, schema=InfrahubKind.REPOSITORY)
+        await repo01.new(
+            db=dbt,
+            name="repo01",
+            description="Repo 01 initial value",
+            location="git@github.com:user/repo01.git",
+            commit="aaaaaaaaaaa",
+        )
+        await repo01.save(db=dbt)
+
+        repo02 = await Node.init(db=dbt, schema=InfrahubKind.REPOSITORY)
+        await repo02.new(
+            db=dbt,
+            name="repo02",
+            description="Repo 02 initial value",
+            location="git@github.com:user/repo02.git",
+            commit="bbbbbbbbbbb",
+        )
+        await repo02.save(db=dbt)
 
     return {"repo01": repo01, "repo02": repo02}
 
 
 @pytest.fixture
 async def read_only_repos_in_main(db: InfrahubDatabase, register_core_models_schema):
-    repo01 = await Node.init(db=db, schema=InfrahubKind.READONLYREPOSITORY)
-    await repo01.new(
-        db=db,
-        name="repo01",
-        description="Repo 01 initial value",
-        location="git@github.com:user/repo01.git",
-        commit="aaaaaaaaaaa",
-        ref="branch-1",
-    )
-    await repo01.save(db=db)
-
-    repo02 = await Node.init(db=db, schema=InfrahubKind.READONLYREPOSITORY)
-    await repo02.new(
-        db=db,
-        name="repo02",
-        description="Repo 02 initial value",
-        location="git@github.com:user/repo02.git",
-        commit="bbbbbbbbbbb",
-        ref="v1.2.3",
-    )
-    await repo02.save(db=db)
+    async with db.start_transaction() as dbt:
+        repo01 = await Node.init(db=dbt, schema=InfrahubKind.READONLYREPOSITORY)
+        await repo01.new(
+            db=dbt,
+            name="repo01",
+            description="Repo 01 initial value",
+            location="git@github.com:user/repo01.git",
+            commit="aaaaaaaaaaa",
+            ref="branch-1",
+        )
+        await repo01.save(db=dbt)
+
+        repo02 = await Node.init(db=dbt, schema=InfrahubKind.READONLYREPOSITORY)
+        await repo02.new(
+            db=dbt,
+            name="repo02",
+            description="Repo 02 initial value",
+            location="git@github.com:user/repo02.git",
+            commit="bbbbbbbbbbb",
+            ref="v1.2.3",
+        )
+        await repo02.save(db=dbt)
 
     return {"repo01": repo01, "repo02": repo02}
 
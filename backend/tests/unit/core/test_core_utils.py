@@ -2,6 +2,7 @@ import pytest
 
 from infrahub.core.models import NodeKind
 from infrahub.core.utils import (
+    count_paths_between_nodes,
     count_relationships,
     delete_all_nodes,
     element_id_to_id,
@@ -68,6 +69,36 @@ async def test_get_paths_between_nodes(db: InfrahubDatabase, empty_database):
     assert len(paths) == 0
 
 
+async def test_count_paths_between_nodes(empty_database, db_rollback: InfrahubDatabase):
+    query = """
+    CREATE (p1:Person { name: "Jim" })
+    CREATE (p2:Person { name: "Jane" })
+    CREATE (p3:Person { name: "Billy" })
+    CREATE (p1)-[r1:KNOWS]->(p2)
+    CREATE (p1)-[r2:KNOWS]->(p3)
+    CREATE (p1)-[r3:IS_FRIENDS_WITH]->(p2)
+    RETURN p1, p2, p3
+    """
+
+    results = await db_rollback.execute_query(query=query)
+    nodes = results[0]
+
+    nbr_paths = await count_paths_between_nodes(
+        db=db_rollback, source_id=nodes[0].element_id, destination_id=nodes[1].element_id
+    )
+    assert nbr_paths == 2
+
+    nbr_paths = await count_paths_between_nodes(
+        db=db_rollback, source_id=nodes[2].element_id, destination_id=nodes[1].element_id, relationships=["KNOWS"]
+    )
+    assert nbr_paths == 1
+
+    nbr_paths = await count_paths_between_nodes(
+        db=db_rollback, source_id=nodes[2].element_id, destination_id=nodes[1].element_id, max_length=1
+    )
+    assert nbr_paths == 0
+
+
 async def test_count_relationships(db: InfrahubDatabase, empty_database):
     query = """
     CREATE (p1:Person { name: "Jim" })
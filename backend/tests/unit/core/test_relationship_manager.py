@@ -5,7 +5,7 @@ from infrahub.core.branch import Branch
 from infrahub.core.node import Node
 from infrahub.core.relationship import RelationshipManager
 from infrahub.core.timestamp import Timestamp
-from infrahub.core.utils import get_paths_between_nodes
+from infrahub.core.utils import count_paths_between_nodes
 from infrahub.database import InfrahubDatabase
 
 
@@ -90,10 +90,10 @@ async def test_one_save_input_obj(db: InfrahubDatabase, tag_blue_main: Node, per
     rel_schema = person_schema.get_relationship("primary_tag")
 
     # We should have only 1 paths between t1 and p1 via the branch
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_blue_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 1
+    assert nbr_paths == 1
 
     relm = await RelationshipManager.init(
         db=db,
@@ -107,10 +107,10 @@ async def test_one_save_input_obj(db: InfrahubDatabase, tag_blue_main: Node, per
 
     # We should have 2 paths between t1 and p1
     # First for the relationship, Second via the branch
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_blue_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 2
+    assert nbr_paths == 2
 
 
 async def test_one_udpate(
@@ -120,10 +120,10 @@ async def test_one_udpate(
     rel_schema = person_schema.get_relationship("primary_tag")
 
     # We should have only 1 paths between t1 and p1 via the branch
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_blue_main.db_id, destination_id=person_jack_primary_tag_main.db_id, max_length=2
     )
-    assert len(paths) == 2
+    assert nbr_paths == 2
 
     relm = await RelationshipManager.init(
         db=db,
@@ -137,10 +137,10 @@ async def test_one_udpate(
 
     # We should have 2 paths between t1 and p1
     # First for the relationship, Second via the branch
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_blue_main.db_id, destination_id=person_jack_primary_tag_main.db_id, max_length=2
     )
-    assert len(paths) == 2
+    assert nbr_paths == 2
 
 
 async def test_many_init_input_obj(
@@ -168,15 +168,15 @@ async def test_many_save_input_obj(
     rel_schema = person_schema.get_relationship("tags")
 
     # We should have only 1 paths between t1 and p1 via the branch
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_blue_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 1
+    assert nbr_paths == 1
 
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_red_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 1
+    assert nbr_paths == 1
 
     relm = await RelationshipManager.init(
         db=db,
@@ -188,15 +188,15 @@ async def test_many_save_input_obj(
     )
     await relm.save(db=db)
 
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_blue_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 2
+    assert nbr_paths == 2
 
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_red_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 2
+    assert nbr_paths == 2
 
 
 async def test_many_update(
@@ -211,41 +211,41 @@ async def test_many_update(
     await relm.save(db=db)
 
     # We should have only 1 paths between t1 and p1 via the branch
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_blue_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 1
+    assert nbr_paths == 1
 
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_red_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 1
+    assert nbr_paths == 1
 
     await relm.update(db=db, data=tag_blue_main)
     await relm.save(db=db)
 
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_blue_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 2
+    assert nbr_paths == 2
 
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_red_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 1
+    assert nbr_paths == 1
 
     await relm.update(db=db, data=[tag_blue_main, tag_red_main])
     await relm.save(db=db)
 
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_blue_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 2
+    assert nbr_paths == 2
 
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_red_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 2
+    assert nbr_paths == 2
 
 
 async def test_many_add(
@@ -259,38 +259,38 @@ async def test_many_add(
     )
     await relm.save(db=db)
 
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_blue_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 1
+    assert nbr_paths == 1
 
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_red_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 1
+    assert nbr_paths == 1
 
     await relm.add(db=db, data=tag_blue_main)
     await relm.save(db=db)
 
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_blue_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 2
+    assert nbr_paths == 2
 
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_red_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 1
+    assert nbr_paths == 1
 
     await relm.add(db=db, data=tag_red_main)
     await relm.save(db=db)
 
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_blue_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 2
+    assert nbr_paths == 2
 
-    paths = await get_paths_between_nodes(
+    nbr_paths = await count_paths_between_nodes(
         db=db, source_id=tag_red_main.db_id, destination_id=person_jack_main.db_id, max_length=2
     )
-    assert len(paths) == 2
+    assert nbr_paths == 2
@@ -53,3 +53,17 @@ async def test_database_transaction(empty_database, db: InfrahubDatabase):
 
     results = await db.execute_query(query=query_books)
     assert len(results) == 2
+
+
+async def test_database_rollback(empty_database, db: InfrahubDatabase, db_rollback: InfrahubDatabase):
+    query_create = 'CREATE (b:Book {name: "book1"}) RETURN b'
+    query_books = "MATCH (b:Book) RETURN b "
+
+    await db_rollback.execute_query(query=query_create)
+
+    # The book is only visible from the transaction, it will be gone once the transaction is rolled back
+    results = await db_rollback.execute_query(query=query_books)
+    assert len(results) == 1
+
+    results = await db.execute_query(query=query_books)
+    assert len(results) == 0